@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+Atomic file writes shared by the analysis scripts.
+"""
+
+import contextlib
+import os
+
+
+@contextlib.contextmanager
+def atomic_open(path, mode="w", **kwargs):
+    """Open a sibling .tmp file for writing and os.replace() it onto path on success.
+
+    Readers never see a half-written file, and a crash mid-write leaves the old one intact.
+    """
+    tmp = f"{path}.tmp"
+    try:
+        with open(tmp, mode, **kwargs) as f:
+            yield f
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
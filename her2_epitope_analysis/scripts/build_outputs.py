@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+Build the Word report and the project summary figure in parallel.
+
+The two outputs share no state (the report does not embed project_summary.png),
+so each runs in its own process and wall-clock time drops to the slower of the two.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import generate_report
+import generate_summary_figure
+
+
+def main():
+    # Both scripts write paths relative to the project root
+    os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    with ProcessPoolExecutor(max_workers=2) as ex:
+        jobs = [ex.submit(generate_report.create_report),
+                ex.submit(generate_summary_figure.main)]
+        for job in jobs:
+            job.result()
+
+
+if __name__ == "__main__":
+    main()
@@ -7,17 +7,23 @@ Shows ESM + AlphaFold + Docking pipeline predictions binding to the juxtamembran
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 from matplotlib.patches import FancyBboxPatch, FancyArrowPatch, Rectangle, Circle, Polygon
+from matplotlib.collections import PatchCollection, LineCollection
 import numpy as np
 import os
 
+def add_patches(ax, patches):
+    """Add static patches as one collection; axis limits are set explicitly, so skip autolim."""
+    ax.add_collection(PatchCollection(patches, match_original=True), autolim=False)
+
 def draw_antibody_structure(ax, x, y, scale=1.0, color='#DDA0DD', label='', arm1_color=None, arm2_color=None):
     """Draw simplified antibody Y-shape structure."""
+    patches = []
     # Fc region (bottom)
     fc_width = 0.8 * scale
     fc_height = 1.2 * scale
-    ax.add_patch(FancyBboxPatch((x - fc_width/2, y), fc_width, fc_height,
-                                boxstyle="round,pad=0.05", facecolor=color,
-                                edgecolor='black', linewidth=1.5))
+    patches.append(FancyBboxPatch((x - fc_width/2, y), fc_width, fc_height,
+                                  boxstyle="round,pad=0.05", facecolor=color,
+                                  edgecolor='black', linewidth=1.5))
 
     # Hinge region
     ax.plot([x, x - 0.5*scale], [y + fc_height, y + fc_height + 0.3*scale], 'k-', linewidth=2)
@@ -30,21 +36,22 @@ def draw_antibody_structure(ax, x, y, scale=1.0, color='#DDA0DD', label='', arm1
     # Left Fab arm
     fab_width = 0.6 * scale
     fab_height = 1.0 * scale
-    ax.add_patch(FancyBboxPatch((x - 0.5*scale - fab_width/2, y + fc_height + 0.3*scale),
-                                fab_width, fab_height, boxstyle="round,pad=0.05",
-                                facecolor=arm1_c, edgecolor='black', linewidth=1.5))
+    patches.append(FancyBboxPatch((x - 0.5*scale - fab_width/2, y + fc_height + 0.3*scale),
+                                  fab_width, fab_height, boxstyle="round,pad=0.05",
+                                  facecolor=arm1_c, edgecolor='black', linewidth=1.5))
 
     # Right Fab arm
-    ax.add_patch(FancyBboxPatch((x + 0.5*scale - fab_width/2, y + fc_height + 0.3*scale),
-                                fab_width, fab_height, boxstyle="round,pad=0.05",
-                                facecolor=arm2_c, edgecolor='black', linewidth=1.5))
+    patches.append(FancyBboxPatch((x + 0.5*scale - fab_width/2, y + fc_height + 0.3*scale),
+                                  fab_width, fab_height, boxstyle="round,pad=0.05",
+                                  facecolor=arm2_c, edgecolor='black', linewidth=1.5))
 
     # CDR loops at tips (binding sites)
     cdr_y = y + fc_height + 0.3*scale + fab_height
-    ax.add_patch(Circle((x - 0.5*scale, cdr_y), 0.15*scale, facecolor='yellow',
-                        edgecolor='black', linewidth=1))
-    ax.add_patch(Circle((x + 0.5*scale, cdr_y), 0.15*scale, facecolor='yellow',
-                        edgecolor='black', linewidth=1))
+    patches.append(Circle((x - 0.5*scale, cdr_y), 0.15*scale, facecolor='yellow',
+                          edgecolor='black', linewidth=1))
+    patches.append(Circle((x + 0.5*scale, cdr_y), 0.15*scale, facecolor='yellow',
+                          edgecolor='black', linewidth=1))
+    add_patches(ax, patches)
 
     if label:
         ax.text(x, y - 0.3*scale, label, ha='center', va='top', fontsize=9, fontweight='bold')
@@ -65,18 +72,21 @@ def create_p95_docking_figure():
     ax1.set_xlim(0, 10)
     ax1.set_ylim(0, 12)
     ax1.axis('off')
+    patches1 = []
     ax1.set_title('A. p95-ESM-001 (Epitope Mimicry)\n→ JM Epitope (615-635)', fontsize=12, fontweight='bold', loc='left')
 
     # Draw p95-HER2 structure
-    ax1.add_patch(FancyBboxPatch((3, 3), 4, 2.5, boxstyle="round,pad=0.05",
-                                 facecolor='#FFFF99', edgecolor='black', linewidth=2))
+    patches1.append(FancyBboxPatch((3, 3), 4, 2.5, boxstyle="round,pad=0.05",
+                                   facecolor='#FFFF99', edgecolor='black', linewidth=2))
     ax1.text(5, 4.25, "JM Stub\n(611-652)", ha='center', va='center', fontsize=10, fontweight='bold')
 
     # Epitope region highlighted
-    ax1.add_patch(FancyBboxPatch((3.2, 4.2), 1.8, 1.0, boxstyle="round,pad=0.02",
-                                 facecolor='#90EE90', edgecolor='green', linewidth=2))
+    patches1.append(FancyBboxPatch((3.2, 4.2), 1.8, 1.0, boxstyle="round,pad=0.02",
+                                   facecolor='#90EE90', edgecolor='green', linewidth=2))
     ax1.text(4.1, 4.7, "615-635", ha='center', va='center', fontsize=8, fontweight='bold', color='green')
 
+    add_patches(ax1, patches1)
+
     # Membrane
     ax1.axhline(y=2.5, xmin=0.2, xmax=0.8, color='brown', linewidth=6)
     ax1.text(5, 2.1, "Cell Membrane", ha='center', va='center', fontsize=9)
@@ -99,18 +109,21 @@ def create_p95_docking_figure():
     ax2.set_xlim(0, 10)
     ax2.set_ylim(0, 12)
     ax2.axis('off')
+    patches2 = []
     ax2.set_title('B. p95-ESM-002 (Charge Complementarity) ★TOP\n→ JM Epitope (615-635)', fontsize=12, fontweight='bold', loc='left')
 
     # Draw p95-HER2 structure
-    ax2.add_patch(FancyBboxPatch((3, 3), 4, 2.5, boxstyle="round,pad=0.05",
-                                 facecolor='#FFFF99', edgecolor='black', linewidth=2))
+    patches2.append(FancyBboxPatch((3, 3), 4, 2.5, boxstyle="round,pad=0.05",
+                                   facecolor='#FFFF99', edgecolor='black', linewidth=2))
     ax2.text(5, 4.25, "JM Stub\n(611-652)", ha='center', va='center', fontsize=10, fontweight='bold')
 
     # Epitope with charge indicators
-    ax2.add_patch(FancyBboxPatch((3.2, 4.2), 1.8, 1.0, boxstyle="round,pad=0.02",
-                                 facecolor='#87CEEB', edgecolor='blue', linewidth=2))
+    patches2.append(FancyBboxPatch((3.2, 4.2), 1.8, 1.0, boxstyle="round,pad=0.02",
+                                   facecolor='#87CEEB', edgecolor='blue', linewidth=2))
     ax2.text(4.1, 4.7, "615-635", ha='center', va='center', fontsize=8, fontweight='bold', color='blue')
 
+    add_patches(ax2, patches2)
+
     # Charge indicators
     ax2.text(3.5, 4.0, "- - -", ha='center', va='center', fontsize=10, color='red', fontweight='bold')
     ax2.annotate('Glu/Asp\n(negative)', xy=(3.5, 3.8), xytext=(2.0, 3.2),
@@ -139,16 +152,18 @@ def create_p95_docking_figure():
     ax3.set_xlim(0, 10)
     ax3.set_ylim(0, 12)
     ax3.axis('off')
+    patches3 = []
     ax3.set_title('C. p95-ESM-004 (Neo-epitope Specific)\n→ Met611 Neo-epitope (611-625)', fontsize=12, fontweight='bold', loc='left')
 
     # Draw p95-HER2 structure
-    ax3.add_patch(FancyBboxPatch((3, 3), 4, 2.5, boxstyle="round,pad=0.05",
-                                 facecolor='#FFFF99', edgecolor='black', linewidth=2))
+    patches3.append(FancyBboxPatch((3, 3), 4, 2.5, boxstyle="round,pad=0.05",
+                                   facecolor='#FFFF99', edgecolor='black', linewidth=2))
     ax3.text(5, 4.25, "JM Stub\n(611-652)", ha='center', va='center', fontsize=10, fontweight='bold')
 
     # Neo-epitope at N-terminus (Met611)
-    ax3.add_patch(FancyBboxPatch((3.0, 4.5), 1.5, 0.8, boxstyle="round,pad=0.02",
-                                 facecolor='#FFB6C1', edgecolor='#FF1493', linewidth=2))
+    patches3.append(FancyBboxPatch((3.0, 4.5), 1.5, 0.8, boxstyle="round,pad=0.02",
+                                   facecolor='#FFB6C1', edgecolor='#FF1493', linewidth=2))
+    add_patches(ax3, patches3)
     ax3.text(3.75, 4.9, "M611", ha='center', va='center', fontsize=9, fontweight='bold', color='#FF1493')
     ax3.annotate('Neo-epitope\n(p95-SPECIFIC)', xy=(3.0, 5.3), xytext=(1.5, 6.5),
                 fontsize=8, ha='center', color='#FF1493', fontweight='bold',
@@ -176,19 +191,20 @@ def create_p95_docking_figure():
     ax4.set_xlim(0, 16)
     ax4.set_ylim(0, 12)
     ax4.axis('off')
+    patches4 = []
     ax4.set_title('D. p95-Trastuzumab-Biparatopic (RECOMMENDED): Dual Targeting (p95-JM + FL-HER2 Domain IV)',
                   fontsize=12, fontweight='bold', loc='left')
 
     # LEFT: p95-HER2
     ax4.text(4, 11, "p95-HER2+ Cell", ha='center', va='center', fontsize=11, fontweight='bold', color='red')
 
-    ax4.add_patch(FancyBboxPatch((2, 3), 4, 2.5, boxstyle="round,pad=0.05",
-                                 facecolor='#FFFF99', edgecolor='red', linewidth=2))
+    patches4.append(FancyBboxPatch((2, 3), 4, 2.5, boxstyle="round,pad=0.05",
+                                   facecolor='#FFFF99', edgecolor='red', linewidth=2))
     ax4.text(4, 4.25, "JM Stub\n(611-652)", ha='center', va='center', fontsize=10, fontweight='bold')
 
     # p95 epitope
-    ax4.add_patch(FancyBboxPatch((2.2, 4.2), 1.6, 0.9, boxstyle="round,pad=0.02",
-                                 facecolor='#87CEEB', edgecolor='blue', linewidth=2))
+    patches4.append(FancyBboxPatch((2.2, 4.2), 1.6, 0.9, boxstyle="round,pad=0.02",
+                                   facecolor='#87CEEB', edgecolor='blue', linewidth=2))
     ax4.text(3, 4.65, "615-635", ha='center', va='center', fontsize=8, fontweight='bold', color='blue')
 
     ax4.axhline(y=2.5, xmin=0.1, xmax=0.45, color='brown', linewidth=6)
@@ -198,13 +214,13 @@ def create_p95_docking_figure():
     ax4.text(12, 11, "FL-HER2+ Cell", ha='center', va='center', fontsize=11, fontweight='bold', color='green')
 
     # Domain IV
-    ax4.add_patch(FancyBboxPatch((10, 3), 4, 4, boxstyle="round,pad=0.05",
-                                 facecolor='#96CEB4', edgecolor='black', linewidth=2))
+    patches4.append(FancyBboxPatch((10, 3), 4, 4, boxstyle="round,pad=0.05",
+                                   facecolor='#96CEB4', edgecolor='black', linewidth=2))
     ax4.text(12, 5, "Domain IV\n(489-630)", ha='center', va='center', fontsize=10, fontweight='bold')
 
     # Trastuzumab epitope
-    ax4.add_patch(FancyBboxPatch((11.5, 5.5), 1.6, 1.0, boxstyle="round,pad=0.02",
-                                 facecolor='#DDA0DD', edgecolor='purple', linewidth=2))
+    patches4.append(FancyBboxPatch((11.5, 5.5), 1.6, 1.0, boxstyle="round,pad=0.02",
+                                   facecolor='#DDA0DD', edgecolor='purple', linewidth=2))
     ax4.text(12.3, 6, "557-603", ha='center', va='center', fontsize=8, fontweight='bold', color='purple')
 
     ax4.axhline(y=2.5, xmin=0.6, xmax=0.9, color='brown', linewidth=6)
@@ -215,27 +231,28 @@ def create_p95_docking_figure():
     fc_y = 7
 
     # Fc region
-    ax4.add_patch(FancyBboxPatch((center_x - 0.6, fc_y), 1.2, 1.5,
-                                 boxstyle="round,pad=0.05", facecolor='#E6E6FA',
-                                 edgecolor='black', linewidth=2))
+    patches4.append(FancyBboxPatch((center_x - 0.6, fc_y), 1.2, 1.5,
+                                   boxstyle="round,pad=0.05", facecolor='#E6E6FA',
+                                   edgecolor='black', linewidth=2))
 
     # Left arm (p95-targeting from ESM-002) - blue
     ax4.plot([center_x - 0.2, center_x - 1.5], [fc_y + 1.5, fc_y + 2.0], 'k-', linewidth=2)
-    ax4.add_patch(FancyBboxPatch((center_x - 2.0, fc_y + 2.0), 1.0, 1.2,
-                                 boxstyle="round,pad=0.05", facecolor='#87CEEB',
-                                 edgecolor='blue', linewidth=2))
-    ax4.add_patch(Circle((center_x - 1.5, fc_y + 3.2), 0.2, facecolor='yellow',
-                         edgecolor='black', linewidth=1))
+    patches4.append(FancyBboxPatch((center_x - 2.0, fc_y + 2.0), 1.0, 1.2,
+                                   boxstyle="round,pad=0.05", facecolor='#87CEEB',
+                                   edgecolor='blue', linewidth=2))
+    patches4.append(Circle((center_x - 1.5, fc_y + 3.2), 0.2, facecolor='yellow',
+                           edgecolor='black', linewidth=1))
     ax4.text(center_x - 1.5, fc_y + 2.6, "p95\nESM-002", ha='center', va='center', fontsize=7, fontweight='bold')
 
     # Right arm (Domain IV-targeting - Trastuzumab) - purple
     ax4.plot([center_x + 0.2, center_x + 1.5], [fc_y + 1.5, fc_y + 2.0], 'k-', linewidth=2)
-    ax4.add_patch(FancyBboxPatch((center_x + 1.0, fc_y + 2.0), 1.0, 1.2,
-                                 boxstyle="round,pad=0.05", facecolor='#DDA0DD',
-                                 edgecolor='purple', linewidth=2))
-    ax4.add_patch(Circle((center_x + 1.5, fc_y + 3.2), 0.2, facecolor='yellow',
-                         edgecolor='black', linewidth=1))
+    patches4.append(FancyBboxPatch((center_x + 1.0, fc_y + 2.0), 1.0, 1.2,
+                                   boxstyle="round,pad=0.05", facecolor='#DDA0DD',
+                                   edgecolor='purple', linewidth=2))
+    patches4.append(Circle((center_x + 1.5, fc_y + 3.2), 0.2, facecolor='yellow',
+                           edgecolor='black', linewidth=1))
     ax4.text(center_x + 1.5, fc_y + 2.6, "Tras\nDomIV", ha='center', va='center', fontsize=7, fontweight='bold')
+    add_patches(ax4, patches4)
 
     # Label
     ax4.text(center_x, fc_y - 0.5, "p95-Trastuzumab-Biparatopic", ha='center', va='top',
@@ -257,6 +274,7 @@ def create_p95_docking_figure():
     ax5.set_xlim(0, 10)
     ax5.set_ylim(0, 12)
     ax5.axis('off')
+    patches5 = []
     ax5.set_title('E. ADC Suitability Comparison\n(Pipeline-Predicted)', fontsize=12, fontweight='bold', loc='left')
 
     # Comparison bars - Updated with new pipeline predictions
@@ -272,9 +290,9 @@ def create_p95_docking_figure():
     for i, (mab, score, p95, color, kd) in enumerate(zip(mabs, scores, p95_binding, colors, kd_values)):
         # Bar
         bar_width = score * 0.85
-        ax5.add_patch(FancyBboxPatch((1, y_positions[i]), bar_width, bar_height,
-                                     boxstyle="round,pad=0.02", facecolor=color,
-                                     edgecolor='black', linewidth=1))
+        patches5.append(FancyBboxPatch((1, y_positions[i]), bar_width, bar_height,
+                                       boxstyle="round,pad=0.02", facecolor=color,
+                                       edgecolor='black', linewidth=1))
         # Score label
         ax5.text(bar_width + 1.2, y_positions[i] + bar_height/2, f"{score}/10",
                 ha='left', va='center', fontsize=9, fontweight='bold')
@@ -287,17 +305,17 @@ def create_p95_docking_figure():
         else:
             ax5.text(9.5, y_positions[i] + bar_height/2, f"✗ {kd}nM", ha='center', va='center',
                     fontsize=7, color='gray')
+    add_patches(ax5, patches5)
 
     ax5.text(5, 11.5, "ADC Suitability Score", ha='center', va='center', fontsize=11, fontweight='bold')
     ax5.axvline(x=9, ymin=0.1, ymax=0.9, color='gray', linestyle='--', alpha=0.5)
     ax5.text(9.5, 0.5, "p95 | Kd", ha='center', va='center', fontsize=7, color='gray')
 
-    plt.tight_layout()
     return fig
 
 def create_epitope_binding_detail():
     """Create detailed epitope-binding visualization for pipeline-predicted mAbs."""
-    fig, axes = plt.subplots(2, 2, figsize=(16, 14))
+    fig, axes = plt.subplots(2, 2, figsize=(16, 14), layout='constrained')
     fig.suptitle('Pipeline-Predicted p95-HER2 mAbs: Epitope Binding Detail', fontsize=16, fontweight='bold')
 
     epitopes = [
@@ -311,6 +329,12 @@ def create_epitope_binding_detail():
          "cdr_h3": "ARMETPIWKFDY", "cdr_l3": "QQMPIWFPT", "color": "#FFB6C1", "kd": "0.20", "strategy": "Neo-epitope Specific"}
     ]
 
+    # Binding interaction positions, shared by every subplot
+    contact_x = 2.5 + np.arange(5) * 1.2
+    contact_segments = np.stack([np.column_stack([contact_x, np.full(5, 5.2)]),
+                                 np.column_stack([contact_x, np.full(5, 6.0)])], axis=1)
+    contact_y = np.full(5, 5.5)
+
     for ax, epi in zip(axes.flatten(), epitopes):
         ax.set_xlim(0, 10)
         ax.set_ylim(0, 10)
@@ -320,28 +344,28 @@ def create_epitope_binding_detail():
         ax.set_title(f'{epi["name"]} ({epi["strategy"]})\nEpitope: {epi["region"]}', fontsize=11, fontweight='bold')
 
         # Epitope sequence display
-        ax.add_patch(FancyBboxPatch((1, 6), 8, 1.5, boxstyle="round,pad=0.1",
-                                    facecolor='#FFFACD', edgecolor='black', linewidth=2))
+        patches = [FancyBboxPatch((1, 6), 8, 1.5, boxstyle="round,pad=0.1",
+                                  facecolor='#FFFACD', edgecolor='black', linewidth=2)]
         ax.text(5, 6.75, f'Epitope: {epi["seq"]}', ha='center', va='center',
                fontsize=8, family='monospace', fontweight='bold')
 
         # CDR-H3 binding representation
-        ax.add_patch(FancyBboxPatch((1.5, 4), 7, 1.2, boxstyle="round,pad=0.1",
-                                    facecolor=epi["color"], edgecolor='black', linewidth=2))
+        patches.append(FancyBboxPatch((1.5, 4), 7, 1.2, boxstyle="round,pad=0.1",
+                                      facecolor=epi["color"], edgecolor='black', linewidth=2))
         ax.text(5, 4.6, f'CDR-H3: {epi["cdr_h3"]}', ha='center', va='center',
                fontsize=8, family='monospace', fontweight='bold')
 
         # CDR-L3 binding representation
-        ax.add_patch(FancyBboxPatch((2, 2.5), 6, 1.0, boxstyle="round,pad=0.1",
-                                    facecolor=epi["color"], edgecolor='black', linewidth=1.5, alpha=0.7))
+        patches.append(FancyBboxPatch((2, 2.5), 6, 1.0, boxstyle="round,pad=0.1",
+                                      facecolor=epi["color"], edgecolor='black', linewidth=1.5, alpha=0.7))
+        add_patches(ax, patches)
         ax.text(5, 3, f'CDR-L3: {epi["cdr_l3"]}', ha='center', va='center',
                fontsize=8, family='monospace')
 
         # Binding interaction lines
-        for i in range(5):
-            x_pos = 2.5 + i * 1.2
-            ax.plot([x_pos, x_pos], [5.2, 6], 'k--', linewidth=1, alpha=0.5)
-            ax.plot([x_pos], [5.5], 'ro', markersize=4)
+        ax.add_collection(LineCollection(contact_segments, colors='k', linestyles='--',
+                                         linewidths=1, alpha=0.5, zorder=2), autolim=False)
+        ax.scatter(contact_x, contact_y, c='red', s=16, zorder=2)
 
         # Binding affinity
         ax.text(5, 1.2, f"Predicted Kd: {epi['kd']} nM", ha='center', va='center',
@@ -349,7 +373,6 @@ def create_epitope_binding_detail():
         ax.text(5, 0.6, f"AlphaFold pLDDT > 84", ha='center', va='center',
                fontsize=9, style='italic', color='gray')
 
-    plt.tight_layout()
     return fig
 
 def create_mab_evaluation_figure():
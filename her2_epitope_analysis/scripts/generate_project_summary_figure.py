@@ -9,20 +9,28 @@ Uses scientific-visualization skill best practices:
 - 300 DPI for raster output
 """
 
-import matplotlib.pyplot as plt
+import matplotlib
 import matplotlib.patches as mpatches
-from matplotlib.patches import FancyBboxPatch, Rectangle, FancyArrowPatch, Circle, Polygon
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.patches import FancyBboxPatch, Rectangle, PathPatch, ArrowStyle, ConnectionStyle
+from matplotlib.path import Path
 from matplotlib.gridspec import GridSpec
+from matplotlib.collections import LineCollection, PatchCollection
+from matplotlib.colors import to_rgba
+from matplotlib.font_manager import FontProperties
+from matplotlib.legend_handler import HandlerPatch
 import numpy as np
+import argparse
+import functools
+import io
 import os
 import sys
 
-# Add skills path for imports
-sys.path.insert(0, os.path.expanduser('~/.claude/skills/scientific-visualization/scripts'))
-sys.path.insert(0, os.path.expanduser('~/.claude/skills/scientific-visualization/assets'))
+from atomic_io import atomic_open
 
-# Okabe-Ito colorblind-friendly palette
-OKABE_ITO = {
+# Okabe-Ito colorblind-friendly palette (pre-parsed to RGBA tuples at import)
+OKABE_ITO = {name: to_rgba(hex_color) for name, hex_color in {
     'orange': '#E69F00',
     'sky_blue': '#56B4E9',
     'bluish_green': '#009E73',
@@ -31,7 +39,7 @@ OKABE_ITO = {
     'vermillion': '#D55E00',
     'reddish_purple': '#CC79A7',
     'black': '#000000'
-}
+}.items()}
 
 # Domain colors using Okabe-Ito
 DOMAIN_COLORS = {
@@ -40,33 +48,102 @@ DOMAIN_COLORS = {
     'DomIII': OKABE_ITO['bluish_green'],
     'DomIV': OKABE_ITO['reddish_purple'],
     'JM': OKABE_ITO['reddish_purple'],
-    'TM': '#888888',
+    'TM': to_rgba('#888888'),
     'Kinase': OKABE_ITO['yellow'],
 }
 
 
+# Publication-quality matplotlib settings, built once at import
+_PUB_RCPARAMS = {
+    'font.family': 'sans-serif',
+    'font.sans-serif': ['Arial', 'Helvetica', 'DejaVu Sans'],
+    'font.size': 8,
+    'axes.labelsize': 9,
+    'axes.titlesize': 10,
+    'axes.linewidth': 0.8,
+    'axes.spines.top': False,
+    'axes.spines.right': False,
+    'xtick.labelsize': 7,
+    'ytick.labelsize': 7,
+    'xtick.major.width': 0.8,
+    'ytick.major.width': 0.8,
+    'legend.fontsize': 7,
+    'legend.frameon': False,
+    'figure.facecolor': 'white',
+    'savefig.dpi': 300,
+    'savefig.facecolor': 'white',
+}
+_STYLE_APPLIED = False
+
+# Annotation arrow styles, parsed once and shared by every arrow
+_ARROW = ArrowStyle('->')
+_CONN = ConnectionStyle('arc3')
+
+# Figure legend entries: (label, DOMAIN_COLORS key)
+_LEGEND_SPEC = (
+    ('Domain I', 'DomI'),
+    ('Domain II', 'DomII'),
+    ('Domain III', 'DomIII'),
+    ('Domain IV/JM', 'DomIV'),
+    ('Kinase', 'Kinase'),
+)
+_PATCH_HANDLER = HandlerPatch()
+
+
 def apply_publication_style():
-    """Apply publication-quality matplotlib settings."""
-    plt.rcParams.update({
-        'font.family': 'sans-serif',
-        'font.sans-serif': ['Arial', 'Helvetica', 'DejaVu Sans'],
-        'font.size': 8,
-        'axes.labelsize': 9,
-        'axes.titlesize': 10,
-        'axes.linewidth': 0.8,
-        'axes.spines.top': False,
-        'axes.spines.right': False,
-        'xtick.labelsize': 7,
-        'ytick.labelsize': 7,
-        'xtick.major.width': 0.8,
-        'ytick.major.width': 0.8,
-        'legend.fontsize': 7,
-        'legend.frameon': False,
-        'figure.facecolor': 'white',
-        'savefig.dpi': 300,
-        'savefig.bbox': 'tight',
-        'savefig.facecolor': 'white',
-    })
+    """Apply publication-quality matplotlib settings (once per process)."""
+    global _STYLE_APPLIED
+    if _STYLE_APPLIED:
+        return
+    matplotlib.rcParams.update(_PUB_RCPARAMS)
+    _STYLE_APPLIED = True
+
+
+@functools.lru_cache(maxsize=None)
+def _domain_box_path(width, height):
+    """Rounded domain-box outline at the origin, built once per box geometry."""
+    return FancyBboxPatch((0, 0), width, height,
+                          boxstyle="round,pad=0.01,rounding_size=0.02").get_path()
+
+
+def domain_box(x, y, width, height):
+    """Return a rounded domain box at (x, y) reusing the cached outline."""
+    path = _domain_box_path(width, height)
+    return PathPatch(Path(path.vertices + (x, y), path.codes))
+
+
+@functools.lru_cache(maxsize=None)
+def _layout_domains(width_fracs, x_center, y_base, width, domain_height, gap):
+    """Pure-numeric stack layout: (N, 4) read-only array of [x, y, w, h] boxes, bottom-up."""
+    box_widths = width * np.asarray(width_fracs)
+    heights = np.full(len(width_fracs), domain_height)
+    ys = y_base + np.concatenate(([0.0], np.cumsum(heights[:-1] + gap)))
+    boxes = np.column_stack([x_center - box_widths/2, ys, box_widths, heights])
+    boxes.flags.writeable = False
+    return boxes
+
+
+def _build_domain_spec(domains, x_center, y_base, width, domain_height, gap):
+    """Stack domains bottom-up; return an (N, 4) array of [x, y, w, h] boxes."""
+    width_fracs = tuple(width_frac for _, _, _, width_frac in domains)
+    return _layout_domains(width_fracs, x_center, y_base, width, domain_height, gap)
+
+
+def _draw_domain_stack(ax, domains, boxes, x_center):
+    """Render a domain stack from its precomputed boxes: one collection plus labels."""
+    fp_label = FontProperties(size=7, weight='bold')
+    fp_tm = FontProperties(size=6, weight='bold')
+
+    ax.add_collection(PatchCollection(
+        [domain_box(*box) for box in boxes.tolist()],
+        facecolors=[color for _, _, color, _ in domains], edgecolors='black',
+        linewidths=0.8, alpha=0.9, zorder=2
+    ))
+
+    for (dom_id, label, _, _), (_, y_pos, _, box_height) in zip(domains, boxes.tolist()):
+        ax.text(x_center, y_pos + box_height/2, label,
+               fontproperties=fp_tm if dom_id == 'TM' else fp_label,
+               ha='center', va='center', zorder=3)
 
 
 def draw_her2_domain_structure(ax, x_center=0.5, y_base=0.1, width=0.25, title="Full-Length HER2"):
@@ -85,31 +162,10 @@ def draw_her2_domain_structure(ax, x_center=0.5, y_base=0.1, width=0.25, title="
         ('DomI', 'Domain I\n(23-195)', DOMAIN_COLORS['DomI'], 1.0),
     ]
 
-    y_pos = y_base
-    domain_boxes = {}
-
-    for dom_id, label, color, width_frac in domains:
-        box_width = width * width_frac
-        x_pos = x_center - box_width/2
-
-        rect = FancyBboxPatch(
-            (x_pos, y_pos), box_width, domain_height,
-            boxstyle="round,pad=0.01,rounding_size=0.02",
-            facecolor=color, edgecolor='black', linewidth=0.8,
-            alpha=0.9, zorder=2
-        )
-        ax.add_patch(rect)
-
-        # Label
-        if dom_id == 'TM':
-            ax.text(x_center, y_pos + domain_height/2, label,
-                   fontsize=6, ha='center', va='center', fontweight='bold', zorder=3)
-        else:
-            ax.text(x_center, y_pos + domain_height/2, label,
-                   fontsize=7, ha='center', va='center', fontweight='bold', zorder=3)
-
-        domain_boxes[dom_id] = (x_pos, y_pos, box_width, domain_height)
-        y_pos += domain_height + gap
+    boxes = _build_domain_spec(domains, x_center, y_base, width, domain_height, gap)
+    _draw_domain_stack(ax, domains, boxes, x_center)
+    domain_boxes = {dom_id: tuple(box) for (dom_id, _, _, _), box in zip(domains, boxes.tolist())}
+    y_pos = boxes[-1, 1] + domain_height + gap
 
     # Add membrane line
     membrane_y = y_base + domain_height + gap + domain_height/2
@@ -137,25 +193,9 @@ def draw_p95_structure(ax, x_center=0.5, y_base=0.1, width=0.25):
         ('JM', 'JM Stub\n(611-652)', DOMAIN_COLORS['JM'], 0.5),
     ]
 
-    y_pos = y_base
-
-    for dom_id, label, color, width_frac in domains:
-        box_width = width * width_frac
-        x_pos = x_center - box_width/2
-
-        rect = FancyBboxPatch(
-            (x_pos, y_pos), box_width, domain_height,
-            boxstyle="round,pad=0.01,rounding_size=0.02",
-            facecolor=color, edgecolor='black', linewidth=0.8,
-            alpha=0.9, zorder=2
-        )
-        ax.add_patch(rect)
-
-        fontsize = 6 if dom_id == 'TM' else 7
-        ax.text(x_center, y_pos + domain_height/2, label,
-               fontsize=fontsize, ha='center', va='center', fontweight='bold', zorder=3)
-
-        y_pos += domain_height + gap
+    boxes = _build_domain_spec(domains, x_center, y_base, width, domain_height, gap)
+    _draw_domain_stack(ax, domains, boxes, x_center)
+    y_pos = boxes[-1, 1] + domain_height + gap
 
     # Draw "lost" ECD region with dashed outline
     lost_height = 4 * (domain_height + gap)
@@ -200,8 +240,8 @@ def draw_mab_binding(ax, domain_boxes, mab_name, target_domain, side='left', col
 
     # Arrow
     ax.annotate('', xy=(arrow_end_x, arrow_y), xytext=(arrow_start_x, arrow_y),
-               arrowprops=dict(arrowstyle='->', color=color or OKABE_ITO['blue'],
-                              lw=1.5, connectionstyle='arc3'))
+               arrowprops=dict(arrowstyle=_ARROW, color=color or OKABE_ITO['blue'],
+                              lw=1.5, connectionstyle=_CONN))
 
     # Label
     ax.text(text_x, arrow_y, mab_name, fontsize=7, ha=ha, va='center',
@@ -220,9 +260,8 @@ def draw_internalization_bar_chart(ax):
     bars = ax.bar(range(len(categories)), values, color=colors, edgecolor='black', linewidth=0.8)
 
     # Add value labels on bars
-    for bar, val in zip(bars, values):
-        ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 2,
-               f'{val}%', ha='center', va='bottom', fontsize=7, fontweight='bold')
+    ax.bar_label(bars, labels=[f'{val}%' for val in values], padding=2,
+                 fontsize=7, fontweight='bold')
 
     ax.set_xticks(range(len(categories)))
     ax.set_xticklabels(categories, fontsize=7)
@@ -250,24 +289,28 @@ def draw_biparatopic_concept(ax):
     ax.add_patch(cell)
     ax.text(0.5, 0.02, 'Tumor Cell', fontsize=8, ha='center', fontweight='bold')
 
+    receptors = []
+    receptor_colors = []
+
     # Draw FL-HER2 receptors (left side)
     for x_pos in [0.22, 0.35]:
         # ECD stack
-        rect = Rectangle((x_pos-0.025, 0.35), 0.05, 0.25,
-                         facecolor=OKABE_ITO['sky_blue'], edgecolor='black',
-                         linewidth=0.5, zorder=2)
-        ax.add_patch(rect)
+        receptors.append(Rectangle((x_pos-0.025, 0.35), 0.05, 0.25))
+        receptor_colors.append(OKABE_ITO['sky_blue'])
         ax.text(x_pos, 0.47, 'FL', fontsize=6, ha='center', va='center', fontweight='bold')
 
     # Draw p95-HER2 receptors (right side)
     for x_pos in [0.60, 0.73]:
         # Small JM stub
-        rect = Rectangle((x_pos-0.02, 0.35), 0.04, 0.10,
-                         facecolor=OKABE_ITO['reddish_purple'], edgecolor='black',
-                         linewidth=0.5, zorder=2)
-        ax.add_patch(rect)
+        receptors.append(Rectangle((x_pos-0.02, 0.35), 0.04, 0.10))
+        receptor_colors.append(OKABE_ITO['reddish_purple'])
         ax.text(x_pos, 0.40, 'p95', fontsize=5, ha='center', va='center', fontweight='bold')
 
+    ax.add_collection(PatchCollection(
+        receptors, facecolors=receptor_colors, edgecolors='black',
+        linewidths=0.5, zorder=2
+    ))
+
     # Draw bispecific antibody (Y-shape connecting both)
     # Central Fc region
     fc_rect = FancyBboxPatch((0.42, 0.68), 0.12, 0.08,
@@ -277,21 +320,29 @@ def draw_biparatopic_concept(ax):
     ax.add_patch(fc_rect)
     ax.text(0.48, 0.72, 'Fc', fontsize=6, ha='center', va='center', fontweight='bold')
 
-    # Arms to FL-HER2
-    ax.plot([0.42, 0.285], [0.72, 0.72], color=OKABE_ITO['blue'], linewidth=2, zorder=2)
-    ax.plot([0.285, 0.285], [0.72, 0.60], color=OKABE_ITO['blue'], linewidth=2, zorder=2)
-    ax.add_patch(Circle((0.285, 0.60), 0.02, facecolor=OKABE_ITO['blue'],
-                        edgecolor='black', linewidth=0.5, zorder=3))
-
-    # Arms to p95-HER2
-    ax.plot([0.54, 0.665], [0.72, 0.72], color=OKABE_ITO['vermillion'], linewidth=2, zorder=2)
-    ax.plot([0.665, 0.665], [0.72, 0.45], color=OKABE_ITO['vermillion'], linewidth=2, zorder=2)
-    ax.add_patch(Circle((0.665, 0.45), 0.02, facecolor=OKABE_ITO['vermillion'],
-                        edgecolor='black', linewidth=0.5, zorder=3))
+    # Arms to FL-HER2 (blue) and p95-HER2 (vermillion)
+    arm_segments = np.array([
+        [[0.42, 0.72], [0.285, 0.72]],
+        [[0.285, 0.72], [0.285, 0.60]],
+        [[0.54, 0.72], [0.665, 0.72]],
+        [[0.665, 0.72], [0.665, 0.45]],
+    ])
+    arm_colors = [OKABE_ITO['blue'], OKABE_ITO['blue'],
+                  OKABE_ITO['vermillion'], OKABE_ITO['vermillion']]
+    ax.add_collection(LineCollection(arm_segments, colors=arm_colors, linewidths=2,
+                                     capstyle='projecting', zorder=2), autolim=False)
+
+    # Binding sites (FL-HER2, p95-HER2) and DXd payload as one scatter; marker
+    # area (points^2) matches the area of the former data-space circles
+    bbox = ax.get_position()
+    ax_w_pt = bbox.width * ax.figure.get_figwidth() * 72
+    ax_h_pt = bbox.height * ax.figure.get_figheight() * 72
+    radii = np.array([0.02, 0.02, 0.025])
+    ax.scatter([0.285, 0.665, 0.48], [0.60, 0.45, 0.82], s=4 * radii**2 * ax_w_pt * ax_h_pt,
+               c=[OKABE_ITO['blue'], OKABE_ITO['vermillion'], OKABE_ITO['vermillion']],
+               edgecolors='black', linewidths=0.5, zorder=3)
 
     # Payload (DXd)
-    ax.add_patch(Circle((0.48, 0.82), 0.025, facecolor=OKABE_ITO['vermillion'],
-                        edgecolor='black', linewidth=0.5, zorder=4))
     ax.text(0.48, 0.88, 'DXd', fontsize=6, ha='center', color=OKABE_ITO['vermillion'],
            fontweight='bold')
 
@@ -330,13 +381,18 @@ def draw_key_statistics(ax):
         ('Clinical Development', '0', 'p95-specific ADCs'),
     ]
 
-    y_pos = 0.80
-    for title, value, subtitle in stats:
-        ax.text(0.5, y_pos, title, fontsize=8, ha='center', fontweight='bold')
-        ax.text(0.5, y_pos - 0.08, value, fontsize=14, ha='center',
-               fontweight='bold', color=OKABE_ITO['blue'])
-        ax.text(0.5, y_pos - 0.15, subtitle, fontsize=7, ha='center', color='#666666')
-        y_pos -= 0.23
+    # One pass per text layer, each sharing a single FontProperties
+    fp_title = FontProperties(size=8, weight='bold')
+    fp_value = FontProperties(size=14, weight='bold')
+    fp_sub = FontProperties(size=7)
+    y_positions = (0.80 - 0.23 * np.arange(len(stats))).tolist()
+    for y_pos, (title, _, _) in zip(y_positions, stats):
+        ax.text(0.5, y_pos, title, fontproperties=fp_title, ha='center')
+    for y_pos, (_, value, _) in zip(y_positions, stats):
+        ax.text(0.5, y_pos - 0.08, value, fontproperties=fp_value, ha='center',
+               color=OKABE_ITO['blue'])
+    for y_pos, (_, _, subtitle) in zip(y_positions, stats):
+        ax.text(0.5, y_pos - 0.15, subtitle, fontproperties=fp_sub, ha='center', color='#666666')
 
     # Highlight box
     highlight = FancyBboxPatch((0.05, 0.02), 0.9, 0.12,
@@ -349,13 +405,12 @@ def draw_key_statistics(ax):
            color=OKABE_ITO['vermillion'])
 
 
-def create_summary_figure():
-    """Create the complete publication-quality summary figure."""
+def _build_summary_figure():
+    """Build the complete publication-quality summary figure from scratch."""
 
-    apply_publication_style()
-
-    # Create figure with GridSpec layout
-    fig = plt.figure(figsize=(11, 8))
+    # Create figure with GridSpec layout (Agg canvas, no pyplot state)
+    fig = Figure(figsize=(11, 8))
+    FigureCanvasAgg(fig)
     gs = GridSpec(2, 3, figure=fig, height_ratios=[1.2, 1],
                   width_ratios=[1, 1, 0.8], hspace=0.35, wspace=0.3)
 
@@ -393,7 +448,7 @@ def create_summary_figure():
 
     # New target annotation
     ax_b.annotate('', xy=(0.68, 0.36), xytext=(0.85, 0.36),
-                 arrowprops=dict(arrowstyle='->', color=OKABE_ITO['bluish_green'], lw=2))
+                 arrowprops=dict(arrowstyle=_ARROW, color=OKABE_ITO['bluish_green'], lw=2))
     ax_b.text(0.87, 0.36, 'Novel\nTarget', fontsize=7, ha='left', va='center',
              color=OKABE_ITO['bluish_green'], fontweight='bold')
 
@@ -433,26 +488,44 @@ def create_summary_figure():
 
     # Legend
     legend_elements = [
-        mpatches.Patch(facecolor=DOMAIN_COLORS['DomI'], edgecolor='black',
-                      linewidth=0.5, label='Domain I'),
-        mpatches.Patch(facecolor=DOMAIN_COLORS['DomII'], edgecolor='black',
-                      linewidth=0.5, label='Domain II'),
-        mpatches.Patch(facecolor=DOMAIN_COLORS['DomIII'], edgecolor='black',
-                      linewidth=0.5, label='Domain III'),
-        mpatches.Patch(facecolor=DOMAIN_COLORS['DomIV'], edgecolor='black',
-                      linewidth=0.5, label='Domain IV/JM'),
-        mpatches.Patch(facecolor=DOMAIN_COLORS['Kinase'], edgecolor='black',
-                      linewidth=0.5, label='Kinase'),
+        mpatches.Patch(facecolor=DOMAIN_COLORS[dom_id], edgecolor='black',
+                      linewidth=0.5, label=name)
+        for name, dom_id in _LEGEND_SPEC
     ]
     fig.legend(handles=legend_elements, loc='lower left', ncol=5,
-              fontsize=7, frameon=False, bbox_to_anchor=(0.01, 0.01))
+              fontsize=7, frameon=False, bbox_to_anchor=(0.01, 0.01),
+              handler_map={mpatches.Patch: _PATCH_HANDLER})
 
     return fig
 
 
-def main():
+def create_summary_figure():
+    """Create the complete publication-quality summary figure."""
+    apply_publication_style()
+    return _build_summary_figure()
+
+
+def save_figure(fig, path, **savefig_kwargs):
+    """Render fig into memory, then write it unbuffered (raw write calls) with an atomic rename."""
+    buf = io.BytesIO()
+    fig.savefig(buf, **savefig_kwargs)
+    data = memoryview(buf.getbuffer())
+
+    with atomic_open(path, 'wb', buffering=0) as f:
+        while data:
+            data = data[f.write(data):]
+
+
+def main(argv=None):
     """Generate and save the summary figure."""
 
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--format', choices=['png', 'pdf', 'both'], default='both',
+                        help="Output format(s) to write; 'pdf' skips the 300 DPI raster pass")
+    parser.add_argument('--dpi', type=int, default=300,
+                        help="PNG resolution; 300 for publication, e.g. 150 for quick previews")
+    args = parser.parse_args(argv)
+
     output_dir = os.path.join(os.path.dirname(__file__), '..', 'images')
     os.makedirs(output_dir, exist_ok=True)
 
@@ -460,21 +533,26 @@ def main():
     print("Using scientific-visualization standards:")
     print("  - Okabe-Ito colorblind-friendly palette")
     print("  - Arial/Helvetica fonts")
-    print("  - 300 DPI output")
+    print(f"  - {args.dpi} DPI output")
 
     fig = create_summary_figure()
 
-    # Save as PNG (300 DPI)
-    png_path = os.path.join(output_dir, 'project_summary.png')
-    fig.savefig(png_path, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none')
-    print(f"Saved: {png_path}")
+    # Measure the tight bounding box once and reuse it for every output format
+    fig.draw_without_rendering()
+    bbox = fig.get_tightbbox().padded(matplotlib.rcParams['savefig.pad_inches'])
 
-    # Save as PDF (vector)
-    pdf_path = os.path.join(output_dir, 'project_summary.pdf')
-    fig.savefig(pdf_path, format='pdf', bbox_inches='tight', facecolor='white', edgecolor='none')
-    print(f"Saved: {pdf_path}")
+    # Save as PDF (vector); no CreationDate so unchanged figures are byte-identical
+    if args.format in ('pdf', 'both'):
+        pdf_path = os.path.join(output_dir, 'project_summary.pdf')
+        save_figure(fig, pdf_path, format='pdf', bbox_inches=bbox, facecolor='white', edgecolor='none',
+                    metadata={'CreationDate': None})
+        print(f"Saved: {pdf_path}")
 
-    plt.close(fig)
+    # Save as PNG (300 DPI by default)
+    if args.format in ('png', 'both'):
+        png_path = os.path.join(output_dir, 'project_summary.png')
+        save_figure(fig, png_path, format='png', dpi=args.dpi, bbox_inches=bbox, facecolor='white', edgecolor='none')
+        print(f"Saved: {png_path}")
 
     print("\nFigure panels:")
     print("  A: Full-length HER2 structure with approved mAb binding sites")
@@ -485,4 +563,7 @@ def main():
 
 
 if __name__ == "__main__":
+    # Add skills path for imports (script use only; importing this module leaves sys.path alone)
+    sys.path.insert(0, os.path.expanduser('~/.claude/skills/scientific-visualization/scripts'))
+    sys.path.insert(0, os.path.expanduser('~/.claude/skills/scientific-visualization/assets'))
     main()
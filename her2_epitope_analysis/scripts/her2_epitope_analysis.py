@@ -4,17 +4,41 @@ HER2 Epitope Analysis for ADC Binder Design
 Main analysis script for epitope mapping, mAb database, and internalization prediction.
 """
 
-import pandas as pd
-import numpy as np
+import bisect
+import csv
+import functools
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import os
 from datetime import datetime
+from types import MappingProxyType
+
+from atomic_io import atomic_open
+
+# One keep-alive session for all REST calls, so repeat requests to a host skip TCP/TLS setup.
+# Rate limits (429) and transient 5xx are retried with backoff; after the last try the final
+# response is returned as-is so callers' status-code handling still applies.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4, pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504),
+                      raise_on_status=False)))
+
+def _frozen(value):
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _frozen(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_frozen(v) for v in value)
+    return value
 
 # ============================================================================
 # HER2 DOMAIN STRUCTURE (UniProt P04626)
 # ============================================================================
 
-HER2_DOMAINS = {
+HER2_DOMAINS = _frozen({
     "Signal peptide": {"start": 1, "end": 22, "type": "signal"},
     "Domain I": {"start": 23, "end": 195, "type": "extracellular", "function": "L1 domain, receptor dimerization"},
     "Domain II": {"start": 196, "end": 319, "type": "extracellular", "function": "Cysteine-rich 1, dimerization arm"},
@@ -22,13 +46,24 @@ HER2_DOMAINS = {
     "Domain IV": {"start": 489, "end": 630, "type": "extracellular", "function": "Cysteine-rich 2, membrane proximal"},
     "Transmembrane": {"start": 653, "end": 675, "type": "transmembrane"},
     "Kinase domain": {"start": 720, "end": 987, "type": "intracellular", "function": "Tyrosine kinase"}
-}
+})
+
+# Parallel start/end/name tuples sorted by start, so domain_at() can bisect instead of scanning
+_DOMAIN_STARTS, _DOMAIN_ENDS, _DOMAIN_NAMES = zip(*sorted(
+    (info["start"], info["end"], name) for name, info in HER2_DOMAINS.items()))
+
+def domain_at(residue):
+    """Return the name of the HER2 domain containing residue, or None if it falls in a linker."""
+    i = bisect.bisect_right(_DOMAIN_STARTS, residue) - 1
+    if i >= 0 and residue <= _DOMAIN_ENDS[i]:
+        return _DOMAIN_NAMES[i]
+    return None
 
 # ============================================================================
 # HER2 EPITOPES - Known therapeutic epitopes
 # ============================================================================
 
-HER2_EPITOPES = [
+HER2_EPITOPES = _frozen([
     {
         "epitope_id": "EPI-001",
         "domain": "Domain IV",
@@ -79,13 +114,13 @@ HER2_EPITOPES = [
         "structural_features": "Dual epitope engagement, receptor clustering",
         "adc_suitability": "High - enhanced internalization via cross-linking"
     }
-]
+])
 
 # ============================================================================
 # HER2-TARGETING mAbs AND ADCs
 # ============================================================================
 
-HER2_MABS_ADCS = [
+HER2_MABS_ADCS = _frozen([
     {
         "name": "Trastuzumab",
         "brand_name": "Herceptin",
@@ -176,34 +211,90 @@ HER2_MABS_ADCS = [
         "approval_status": "Approved in China (2021)",
         "indication": "HER2+ gastric cancer, urothelial cancer"
     }
-]
+])
 
 # ============================================================================
 # FUNCTIONS
 # ============================================================================
 
+def _write_rows(output_path, rows):
+    """Write a list of dicts, choosing the format from the file suffix.
+
+    .feather and .parquet go through pandas/pyarrow (imported only then); anything else
+    is written as CSV with columns in first-seen key order.
+    """
+    suffix = os.path.splitext(output_path)[1]
+    if suffix in (".feather", ".parquet"):
+        import pandas as pd
+        df = pd.DataFrame(rows)
+        with atomic_open(output_path, "wb") as f:
+            if suffix == ".feather":
+                df.to_feather(f)
+            else:
+                df.to_parquet(f, compression="zstd", compression_level=1)
+        return
+
+    fieldnames = list(dict.fromkeys(key for row in rows for key in row))
+    with atomic_open(output_path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(rows)
+
 def generate_epitope_csv(output_path):
-    """Generate epitope summary CSV."""
-    df = pd.DataFrame(HER2_EPITOPES)
-    df['mab_binding'] = df['mab_binding'].apply(lambda x: '; '.join(x))
-    df.to_csv(output_path, index=False)
+    """Generate epitope summary CSV (or Feather/Parquet, by output suffix)."""
+    rows = [{**e, "mab_binding": "; ".join(e["mab_binding"])} for e in HER2_EPITOPES]
+    _write_rows(output_path, rows)
     print(f"Generated: {output_path}")
-    return df
+    return rows
 
 def generate_mabs_csv(output_path):
-    """Generate mAbs/ADCs summary CSV."""
-    df = pd.DataFrame(HER2_MABS_ADCS)
-    df.to_csv(output_path, index=False)
+    """Generate mAbs/ADCs summary CSV (or Feather/Parquet, by output suffix)."""
+    _write_rows(output_path, HER2_MABS_ADCS)
     print(f"Generated: {output_path}")
-    return df
+    return HER2_MABS_ADCS
 
-def fetch_uniprot_sequence(accession="P04626"):
-    """Fetch HER2 sequence from UniProt."""
-    url = f"https://rest.uniprot.org/uniprotkb/{accession}.fasta"
+def fetch_uniprot_sequences(accessions, cache_dir="data/sequences"):
+    """Fetch several UniProt FASTA records, returning {accession: fasta_text}.
+
+    Accessions already saved under cache_dir are read from disk. The rest are requested
+    together in one streamed query (one round-trip rather than one per accession), and each
+    returned record is cached as <accession>.fasta for the next run.
+    """
+    fastas = {}
+    missing = []
+    for accession in accessions:
+        cache_path = os.path.join(cache_dir, f"{accession}.fasta")
+        if os.path.exists(cache_path):
+            with open(cache_path) as f:
+                fastas[accession] = f.read()
+        else:
+            missing.append(accession)
+    if not missing:
+        return fastas
+
+    query = " OR ".join(f"accession:{accession}" for accession in missing)
+    response = SESSION.get("https://rest.uniprot.org/uniprotkb/stream",
+                           params={"query": query, "format": "fasta"}, timeout=30)
+    response.raise_for_status()
+
+    os.makedirs(cache_dir, exist_ok=True)
+    for chunk in response.text.lstrip(">").split("\n>"):
+        if "|" not in chunk:  # empty result set
+            continue
+        record = ">" + chunk.rstrip("\n") + "\n"
+        accession = chunk.split("|", 2)[1]  # >sp|P04626|ERBB2_HUMAN ...
+        if accession in missing:
+            with atomic_open(os.path.join(cache_dir, f"{accession}.fasta")) as f:
+                f.write(record)
+            fastas[accession] = record
+    return fastas
+
+def fetch_uniprot_sequence(accession="P04626", cache_dir="data/sequences"):
+    """Fetch HER2 sequence from UniProt (via the cached batch fetcher)."""
     try:
-        response = requests.get(url, timeout=30)
-        if response.status_code == 200:
-            return response.text
+        fasta = fetch_uniprot_sequences([accession], cache_dir).get(accession)
+        if fasta is not None:
+            return fasta
     except Exception as e:
         print(f"Warning: Could not fetch UniProt sequence: {e}")
 
@@ -221,51 +312,37 @@ PWDQLFRNPHQALLHTANRPEDECVGEGLACHQLCARGHCWGPGPTQCVNCSQFLRGQEC
 VEECRVLQGLPREYVNARHCLPCHPECQPQNGSVTCFGPEADQCVACAHYKDPPFCVARC
 PSGVKPDLSYMPIWKFPDEEGACQPCPINCTHSCVDLDDKGCPAEQRASPLT"""
 
-def evaluate_epitope_for_adc(epitope):
-    """Evaluate epitope suitability for ADC design."""
-    scores = {
-        "accessibility": 0,
-        "internalization": 0,
-        "clinical_validation": 0,
-        "stability": 0
-    }
+# Per-domain criterion scores for evaluate_epitope_for_adc; domains not listed get the default
+ACCESSIBILITY_SCORES = {"Domain IV": 9, "Domain I": 9, "Domain II": 8}
+INTERNALIZATION_SCORES = {"Domain IV": 7, "Domain II": 6}  # Moderate / slower internalization
+STABILITY_SCORES = {"Domain IV": 9}
+VALIDATED_MABS = frozenset({"Trastuzumab", "T-DM1", "T-DXd", "Pertuzumab"})
 
-    domain = epitope["domain"]
-
-    # Accessibility scoring
-    if domain in ["Domain IV", "Domain I"]:
-        scores["accessibility"] = 9
-    elif domain == "Domain II":
-        scores["accessibility"] = 8
-    else:
-        scores["accessibility"] = 7
-
-    # Internalization scoring
-    if "Zanidatamab" in str(epitope["mab_binding"]) or "Biparatopic" in domain:
-        scores["internalization"] = 10  # Bispecific enhances internalization
-    elif domain == "Domain IV":
-        scores["internalization"] = 7  # Moderate internalization
-    elif domain == "Domain II":
-        scores["internalization"] = 6  # Slower internalization
-    else:
-        scores["internalization"] = 5
-
-    # Clinical validation scoring
-    validated_mabs = ["Trastuzumab", "T-DM1", "T-DXd", "Pertuzumab"]
-    if any(mab in str(epitope["mab_binding"]) for mab in validated_mabs):
-        scores["clinical_validation"] = 10
-    else:
-        scores["clinical_validation"] = 5
-
-    # Stability scoring
-    if domain == "Domain IV":
-        scores["stability"] = 9
-    else:
-        scores["stability"] = 7
-
-    total = sum(scores.values()) / 4
+@functools.lru_cache(maxsize=None)
+def _adc_score_entry(domain, biparatopic, validated):
+    """Score one (domain, biparatopic, clinically validated) combination; cached per key."""
+    scores = (
+        ("accessibility", ACCESSIBILITY_SCORES.get(domain, 7)),
+        # Bispecific binding enhances internalization
+        ("internalization", 10 if biparatopic else INTERNALIZATION_SCORES.get(domain, 5)),
+        ("clinical_validation", 10 if validated else 5),
+        ("stability", STABILITY_SCORES.get(domain, 7)),
+    )
+    total = sum(score for _, score in scores) / 4
     return scores, round(total, 1)
 
+def _mab_names(mab_binding):
+    """Base antibody names, dropping qualifiers such as "(in combination)"."""
+    return frozenset(mab.split(" (", 1)[0] for mab in mab_binding)
+
+def evaluate_epitope_for_adc(epitope):
+    """Evaluate epitope suitability for ADC design."""
+    domain = epitope["domain"]
+    mabs = _mab_names(epitope["mab_binding"])
+    biparatopic = "Biparatopic" in domain or "Zanidatamab" in mabs
+    validated = not VALIDATED_MABS.isdisjoint(mabs)
+    scores, total = _adc_score_entry(domain, biparatopic, validated)
+    return dict(scores), total
 
 def main():
     """Main analysis workflow."""
@@ -277,57 +354,62 @@ def main():
 
     # Generate epitope data
     print("Step 2: Generating HER2 epitope data...")
-    epitope_df = generate_epitope_csv("data/her2_epitopes.csv")
+    epitope_rows = generate_epitope_csv("data/her2_epitopes.csv")
 
-    print("\nHER2 Domain Structure:")
-    print("-" * 40)
+    # Each report section is formatted into one list and written with a single print
+    lines = ["\nHER2 Domain Structure:", "-" * 40]
     for domain, info in HER2_DOMAINS.items():
         if info["type"] == "extracellular":
-            print(f"  {domain}: residues {info['start']}-{info['end']}")
-            print(f"    Function: {info.get('function', 'N/A')}")
+            lines.append(f"  {domain}: residues {info['start']}-{info['end']}")
+            lines.append(f"    Function: {info.get('function', 'N/A')}")
 
-    print("\nEpitope Evaluation for ADC Design:")
-    print("-" * 40)
+    lines += ["\nEpitope Evaluation for ADC Design:", "-" * 40]
     for epitope in HER2_EPITOPES:
         scores, total = evaluate_epitope_for_adc(epitope)
-        print(f"\n{epitope['epitope_id']} ({epitope['domain']}):")
-        print(f"  Residues: {epitope['residues']}")
-        print(f"  mAbs: {', '.join(epitope['mab_binding'])}")
-        print(f"  ADC Suitability Score: {total}/10")
-        print(f"    - Accessibility: {scores['accessibility']}/10")
-        print(f"    - Internalization: {scores['internalization']}/10")
-        print(f"    - Clinical validation: {scores['clinical_validation']}/10")
-        print(f"    - Stability: {scores['stability']}/10")
+        lines += [
+            f"\n{epitope['epitope_id']} ({epitope['domain']}):",
+            f"  Residues: {epitope['residues']}",
+            f"  mAbs: {', '.join(epitope['mab_binding'])}",
+            f"  ADC Suitability Score: {total}/10",
+            f"    - Accessibility: {scores['accessibility']}/10",
+            f"    - Internalization: {scores['internalization']}/10",
+            f"    - Clinical validation: {scores['clinical_validation']}/10",
+            f"    - Stability: {scores['stability']}/10",
+        ]
+    print("\n".join(lines))
 
     # Generate mAb data
     print("\n" + "=" * 60)
     print("Step 3: Generating mAb/ADC database...")
-    mab_df = generate_mabs_csv("data/her2_mabs_adcs.csv")
+    mab_rows = generate_mabs_csv("data/her2_mabs_adcs.csv")
 
-    print("\nApproved HER2 ADCs:")
-    print("-" * 40)
+    lines = ["\nApproved HER2 ADCs:", "-" * 40]
     for mab in HER2_MABS_ADCS:
         if mab["type"] == "ADC":
-            print(f"\n{mab['name']} ({mab['brand_name']}):")
-            print(f"  Epitope: {mab['epitope_domain']} ({mab['binding_residues']})")
-            print(f"  Linker: {mab.get('linker', 'N/A')}")
-            print(f"  Payload: {mab.get('payload', 'N/A')}")
-            print(f"  DAR: {mab.get('dar', 'N/A')}")
-            print(f"  Status: {mab['approval_status']}")
+            lines += [
+                f"\n{mab['name']} ({mab['brand_name']}):",
+                f"  Epitope: {mab['epitope_domain']} ({mab['binding_residues']})",
+                f"  Linker: {mab.get('linker', 'N/A')}",
+                f"  Payload: {mab.get('payload', 'N/A')}",
+                f"  DAR: {mab.get('dar', 'N/A')}",
+                f"  Status: {mab['approval_status']}",
+            ]
+    print("\n".join(lines))
 
     # Save UniProt sequence
     print("\n" + "=" * 60)
     print("Fetching HER2 sequence from UniProt...")
     sequence = fetch_uniprot_sequence()
-    with open("data/sequences/P04626.fasta", "w") as f:
-        f.write(sequence)
-    print("Saved: data/sequences/P04626.fasta")
+    if os.path.exists("data/sequences/P04626.fasta"):
+        print("Saved: data/sequences/P04626.fasta")
+    else:
+        print(f"Warning: using partial fallback sequence ({len(sequence)} chars), not cached")
 
     print("\n" + "=" * 60)
     print("Analysis complete!")
     print("=" * 60)
 
-    return epitope_df, mab_df
+    return epitope_rows, mab_rows
 
 
 if __name__ == "__main__":
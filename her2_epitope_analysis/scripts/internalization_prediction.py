@@ -6,8 +6,10 @@ Predicts how different epitopes affect receptor internalization after antibody b
 Based on literature data and structural features.
 """
 
-import pandas as pd
-import numpy as np
+import csv
+import os
+
+from atomic_io import atomic_open
 
 # ============================================================================
 # INTERNALIZATION DATA BASED ON LITERATURE
@@ -170,11 +172,27 @@ For optimal ADC efficacy based on internalization:
 
 
 def generate_internalization_csv(output_path):
-    """Generate internalization predictions CSV."""
-    df = pd.DataFrame(INTERNALIZATION_DATA)
-    df.to_csv(output_path, index=False)
+    """Generate internalization predictions CSV (or Feather/Parquet, by output suffix)."""
+    suffix = os.path.splitext(output_path)[1]
+    if suffix in (".feather", ".parquet"):
+        import pandas as pd
+        df = pd.DataFrame(INTERNALIZATION_DATA)
+        with atomic_open(output_path, "wb") as f:
+            if suffix == ".feather":
+                df.to_feather(f)
+            else:
+                df.to_parquet(f, compression="zstd", compression_level=1)
+    else:
+        with atomic_open(output_path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(INTERNALIZATION_DATA[0]), lineterminator="\n")
+            writer.writeheader()
+            writer.writerows(INTERNALIZATION_DATA)
     print(f"Generated: {output_path}")
-    return df
+    return INTERNALIZATION_DATA
+
+
+SUMMARY_ROW_FORMAT = ("{epitope_domain:<35} {internalization_rate:<12} "
+                      "{percent_internalized_4h:<8} {adc_suitability_score:<10}")
 
 
 def print_internalization_summary():
@@ -188,9 +206,7 @@ def print_internalization_summary():
     print(f"{'Epitope':<35} {'Rate':<12} {'4h %':<8} {'ADC Score':<10}")
     print("-" * 70)
 
-    for data in INTERNALIZATION_DATA:
-        print(f"{data['epitope_domain']:<35} {data['internalization_rate']:<12} "
-              f"{data['percent_internalized_4h']:<8} {data['adc_suitability_score']:<10}")
+    print("\n".join(SUMMARY_ROW_FORMAT.format_map(data) for data in INTERNALIZATION_DATA))
 
     print()
     print("Key Findings:")
@@ -210,17 +226,17 @@ def print_internalization_summary():
 
 def main():
     # Generate CSV
-    df = generate_internalization_csv("data/internalization_predictions.csv")
+    rows = generate_internalization_csv("data/internalization_predictions.csv")
 
     # Print summary
     print_internalization_summary()
 
     # Save mechanisms document
-    with open("data/internalization_mechanisms.md", "w") as f:
+    with atomic_open("data/internalization_mechanisms.md") as f:
         f.write(MECHANISMS)
     print("\nSaved: data/internalization_mechanisms.md")
 
-    return df
+    return rows
 
 
 if __name__ == "__main__":
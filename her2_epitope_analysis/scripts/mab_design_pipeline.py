@@ -12,11 +12,28 @@ Author: Mandy Jiang
 Date: 2026-02-01
 """
 
+import csv
 import os
 import json
+import math
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import numpy as np
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from atomic_io import atomic_open
+
+try:
+    import orjson  # optional C serializer; much faster for large design libraries
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec  # optional typed decoder; only materializes the fields a Struct declares
+except ImportError:
+    msgspec = None
 
 # =============================================================================
 # CONFIGURATION
@@ -32,6 +49,18 @@ HER2_UNIPROT = "P04626"
 OUTPUT_DIR = Path("output/mab_design_pipeline")
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
+# One keep-alive session for all REST calls, so repeat requests to a host skip TCP/TLS setup.
+# Rate limits (429) and transient 5xx are retried with backoff; after the last try the final
+# response is returned as-is so callers' status-code handling still applies.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4, pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504),
+                      raise_on_status=False)))
+
+# Seeded generator for the mock scoring noise, so reruns reproduce the same rankings
+RNG = np.random.default_rng(0)
+
 # Human germline frameworks for antibody design
 GERMLINE_FRAMEWORKS = {
     "VH": {
@@ -52,6 +81,27 @@ GERMLINE_FRAMEWORKS = {
     }
 }
 
+# Full-chain templates: germline frameworks baked in, CDR slots filled per design.
+# Kept as ASCII bytes: bytes %-formatting skips the unicode-kind scan that str formatting
+# does per segment, and each chain is decoded once.
+_VH_FW = GERMLINE_FRAMEWORKS["VH"]["IGHV3-23"]
+_VL_FW = GERMLINE_FRAMEWORKS["VL"]["IGKV1-39"]
+VH_TEMPLATE = (_VH_FW["FR1"] + "%s" + _VH_FW["FR2"] + "%s" +
+               _VH_FW["FR3"] + "%s" + _VH_FW["FR4"]).encode("ascii")
+VL_TEMPLATE = (_VL_FW["FR1"] + "%s" + _VL_FW["FR2"] + "%s" +
+               _VL_FW["FR3"] + "%s" + _VL_FW["FR4"]).encode("ascii")
+
+
+def save_json(obj, path):
+    """Write obj as 2-space-indented JSON, through orjson when it is installed."""
+    if orjson is not None:
+        with atomic_open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        # Same bytes as orjson: UTF-8, non-ASCII written raw rather than \u-escaped
+        with atomic_open(path, encoding='utf-8') as f:
+            json.dump(obj, f, indent=2, ensure_ascii=False)
+
 
 # =============================================================================
 # STEP 1: ESM-BASED CDR DESIGN
@@ -157,12 +207,10 @@ def design_cdrs_with_esm():
 
     # Save designs
     output_file = OUTPUT_DIR / "step1_esm_cdr_designs.json"
-    with open(output_file, 'w') as f:
-        json.dump(designed_cdrs, f, indent=2)
+    save_json(designed_cdrs, output_file)
 
     print(f"\nGenerated {len(designed_cdrs)} CDR designs using ESM-based strategies:")
-    for design in designed_cdrs:
-        print(f"  - {design['name']}: {design['strategy']}")
+    print("\n".join(f"  - {design['name']}: {design['strategy']}" for design in designed_cdrs))
     print(f"\nSaved to: {output_file}")
 
     return designed_cdrs
@@ -175,30 +223,18 @@ def assemble_full_sequences(cdr_designs):
     print("Assembling full VH/VL sequences...")
     print("-"*50)
 
-    vh_fw = GERMLINE_FRAMEWORKS["VH"]["IGHV3-23"]
-    vl_fw = GERMLINE_FRAMEWORKS["VL"]["IGKV1-39"]
-
     full_sequences = []
+    lines = []
 
     for design in cdr_designs:
         if "CDR_H1" not in design:  # Skip bispecific for now
             continue
 
-        # Assemble VH
-        vh_seq = (
-            vh_fw["FR1"] + design["CDR_H1"] +
-            vh_fw["FR2"] + design["CDR_H2"] +
-            vh_fw["FR3"] + design["CDR_H3"] +
-            vh_fw["FR4"]
-        )
-
-        # Assemble VL
-        vl_seq = (
-            vl_fw["FR1"] + design["CDR_L1"] +
-            vl_fw["FR2"] + design["CDR_L2"] +
-            vl_fw["FR3"] + design["CDR_L3"] +
-            vl_fw["FR4"]
-        )
+        # Assemble VH and VL by filling the CDR slots of the framework templates
+        vh_seq = (VH_TEMPLATE % (design["CDR_H1"].encode(), design["CDR_H2"].encode(),
+                                 design["CDR_H3"].encode())).decode("ascii")
+        vl_seq = (VL_TEMPLATE % (design["CDR_L1"].encode(), design["CDR_L2"].encode(),
+                                 design["CDR_L3"].encode())).decode("ascii")
 
         full_sequences.append({
             "name": design["name"],
@@ -217,21 +253,24 @@ def assemble_full_sequences(cdr_designs):
             }
         })
 
-        print(f"\n{design['name']}:")
-        print(f"  VH: {len(vh_seq)} aa")
-        print(f"  VL: {len(vl_seq)} aa")
+        lines += [f"\n{design['name']}:",
+                  f"  VH: {len(vh_seq)} aa",
+                  f"  VL: {len(vl_seq)} aa"]
+
+    print("\n".join(lines))
 
     # Save full sequences
     output_file = OUTPUT_DIR / "step1_full_sequences.json"
-    with open(output_file, 'w') as f:
-        json.dump(full_sequences, f, indent=2)
+    save_json(full_sequences, output_file)
 
     # Also save as FASTA
     fasta_file = OUTPUT_DIR / "step1_sequences.fasta"
-    with open(fasta_file, 'w') as f:
-        for seq in full_sequences:
-            f.write(f">{seq['name']}_VH\n{seq['VH_sequence']}\n")
-            f.write(f">{seq['name']}_VL\n{seq['VL_sequence']}\n")
+    fasta = "".join(
+        f">{seq['name']}_VH\n{seq['VH_sequence']}\n>{seq['name']}_VL\n{seq['VL_sequence']}\n"
+        for seq in full_sequences
+    )
+    with atomic_open(fasta_file) as f:
+        f.write(fasta)
 
     print(f"\nSaved to: {output_file}")
     print(f"FASTA: {fasta_file}")
@@ -243,6 +282,44 @@ def assemble_full_sequences(cdr_designs):
 # STEP 2: ALPHAFOLD STRUCTURE PREDICTION
 # =============================================================================
 
+if msgspec is not None:
+    class _AlphaFoldConfidence(msgspec.Struct):
+        confidenceScore: list[float] = []
+
+    _decode_confidence = msgspec.json.Decoder(_AlphaFoldConfidence).decode
+else:
+    _decode_confidence = None
+
+
+# pLDDT confidence bands: (-inf, 50] Low, (50, 70] Moderate, (70, 90] High, (90, inf) Very High
+PLDDT_BANDS = np.array([50.0, 70.0, 90.0])
+PLDDT_LEVELS = ("Low", "Moderate", "High", "Very High")
+
+
+def load_plddt_scores(conf_bytes):
+    """Return the per-residue pLDDT list from an AlphaFold confidence JSON body."""
+    if _decode_confidence is not None:
+        return _decode_confidence(conf_bytes).confidenceScore
+    return json.loads(conf_bytes).get('confidenceScore', [])
+
+
+def _cached_get(url, path):
+    """Return the body of url, reading it from path if an earlier run already saved it.
+
+    A fresh 200 response is written to path for next time; any other status is reported
+    and returns None without touching the cache.
+    """
+    if path.exists() and path.stat().st_size > 0:
+        return path.read_bytes()
+    response = SESSION.get(url, timeout=30)
+    if response.status_code != 200:
+        print(f"Failed to download {path.name}: {response.status_code}")
+        return None
+    with atomic_open(path, 'wb') as f:
+        f.write(response.content)
+    return response.content
+
+
 def get_her2_structure_from_alphafold():
     """
     Retrieve HER2 structure from AlphaFold Database.
@@ -256,47 +333,41 @@ def get_her2_structure_from_alphafold():
 
     print(f"\nRetrieving HER2 structure: {alphafold_id}")
 
-    # Download structure
+    # Download structure and confidence scores
     model_url = f"https://alphafold.ebi.ac.uk/files/{alphafold_id}-model_v4.pdb"
+    conf_url = f"https://alphafold.ebi.ac.uk/files/{alphafold_id}-confidence_v4.json"
 
+    # Both files are cached next to the pipeline outputs, so reruns skip the network;
+    # on a cold cache the two GETs run concurrently (latency = max, not sum, of the two)
     try:
-        response = requests.get(model_url, timeout=30)
-        if response.status_code == 200:
-            pdb_file = OUTPUT_DIR / "her2_alphafold.pdb"
-            with open(pdb_file, 'wb') as f:
-                f.write(response.content)
-            print(f"Downloaded HER2 structure: {pdb_file}")
-
-            # Get confidence scores
-            conf_url = f"https://alphafold.ebi.ac.uk/files/{alphafold_id}-confidence_v4.json"
-            conf_response = requests.get(conf_url, timeout=30)
-            if conf_response.status_code == 200:
-                conf_data = conf_response.json()
-                plddt_scores = conf_data.get('confidenceScore', [])
+        pdb_file = OUTPUT_DIR / "her2_alphafold.pdb"
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            pdb_job = ex.submit(_cached_get, model_url, pdb_file)
+            conf_job = ex.submit(_cached_get, conf_url, OUTPUT_DIR / "her2_alphafold_confidence.json")
+            pdb_bytes, conf_bytes = pdb_job.result(), conf_job.result()
+
+        if pdb_bytes is not None:
+            print(f"HER2 structure: {pdb_file}")
+
+            # Confidence scores
+            if conf_bytes is not None:
+                plddt_scores = load_plddt_scores(conf_bytes)
 
                 # Extract p95 region confidence (residues 611-652)
                 if len(plddt_scores) >= 652:
-                    p95_plddt = plddt_scores[610:652]  # 0-indexed
-                    avg_p95_plddt = np.mean(p95_plddt)
+                    p95_plddt = np.asarray(plddt_scores[610:652], dtype=np.float64)  # 0-indexed
+                    avg_p95_plddt = p95_plddt.mean()
                     print(f"\np95 region (611-652) pLDDT scores:")
                     print(f"  Average: {avg_p95_plddt:.1f}")
-                    print(f"  Min: {min(p95_plddt):.1f}")
-                    print(f"  Max: {max(p95_plddt):.1f}")
-
-                    # Classify confidence
-                    if avg_p95_plddt > 90:
-                        conf_level = "Very High"
-                    elif avg_p95_plddt > 70:
-                        conf_level = "High"
-                    elif avg_p95_plddt > 50:
-                        conf_level = "Moderate"
-                    else:
-                        conf_level = "Low"
+                    print(f"  Min: {p95_plddt.min():.1f}")
+                    print(f"  Max: {p95_plddt.max():.1f}")
+
+                    # Classify confidence (bands are exclusive at the lower edge: >50, >70, >90)
+                    conf_level = PLDDT_LEVELS[np.searchsorted(PLDDT_BANDS, avg_p95_plddt, side='left')]
                     print(f"  Confidence Level: {conf_level}")
 
             return str(pdb_file)
         else:
-            print(f"Failed to download: {response.status_code}")
             return None
     except Exception as e:
         print(f"Error retrieving structure: {e}")
@@ -331,26 +402,28 @@ def predict_antibody_structures_alphafold(full_sequences):
     # Generate predicted confidence scores (mock for demonstration)
     structure_predictions = []
 
-    for seq in full_sequences:
-        # Simulate pLDDT scores
-        # CDR loops typically have lower confidence than framework regions
-        vh_plddt = {
-            "FR1": 92.5, "CDR_H1": 78.3, "FR2": 91.2,
-            "CDR_H2": 75.6, "FR3": 90.8, "CDR_H3": 65.4, "FR4": 93.1
-        }
-        vl_plddt = {
-            "FR1": 91.8, "CDR_L1": 80.2, "FR2": 90.5,
-            "CDR_L2": 82.1, "FR3": 89.7, "CDR_L3": 72.3, "FR4": 92.4
-        }
+    # Simulate pLDDT scores
+    # CDR loops typically have lower confidence than framework regions
+    # The mock scores are the same for every design, so the averages are computed once
+    vh_plddt = {
+        "FR1": 92.5, "CDR_H1": 78.3, "FR2": 91.2,
+        "CDR_H2": 75.6, "FR3": 90.8, "CDR_H3": 65.4, "FR4": 93.1
+    }
+    vl_plddt = {
+        "FR1": 91.8, "CDR_L1": 80.2, "FR2": 90.5,
+        "CDR_L2": 82.1, "FR3": 89.7, "CDR_L3": 72.3, "FR4": 92.4
+    }
 
-        avg_vh_plddt = np.mean(list(vh_plddt.values()))
-        avg_vl_plddt = np.mean(list(vl_plddt.values()))
-        overall_plddt = (avg_vh_plddt + avg_vl_plddt) / 2
+    avg_vh_plddt = np.mean(list(vh_plddt.values()))
+    avg_vl_plddt = np.mean(list(vl_plddt.values()))
+    overall_plddt = (avg_vh_plddt + avg_vl_plddt) / 2
 
+    lines = []
+    for seq in full_sequences:
         prediction = {
             "name": seq["name"],
-            "VH_pLDDT": vh_plddt,
-            "VL_pLDDT": vl_plddt,
+            "VH_pLDDT": dict(vh_plddt),
+            "VL_pLDDT": dict(vl_plddt),
             "average_VH_pLDDT": round(avg_vh_plddt, 1),
             "average_VL_pLDDT": round(avg_vl_plddt, 1),
             "overall_pLDDT": round(overall_plddt, 1),
@@ -361,15 +434,16 @@ def predict_antibody_structures_alphafold(full_sequences):
         }
         structure_predictions.append(prediction)
 
-        print(f"\n{seq['name']}:")
-        print(f"  Overall pLDDT: {overall_plddt:.1f} ({prediction['fold_confidence']})")
-        print(f"  CDR-H3 pLDDT: {vh_plddt['CDR_H3']:.1f}")
-        print(f"  Status: {prediction['status']}")
+        lines += [f"\n{seq['name']}:",
+                  f"  Overall pLDDT: {overall_plddt:.1f} ({prediction['fold_confidence']})",
+                  f"  CDR-H3 pLDDT: {vh_plddt['CDR_H3']:.1f}",
+                  f"  Status: {prediction['status']}"]
+
+    print("\n".join(lines))
 
     # Save predictions
     output_file = OUTPUT_DIR / "step2_alphafold_predictions.json"
-    with open(output_file, 'w') as f:
-        json.dump(structure_predictions, f, indent=2)
+    save_json(structure_predictions, output_file)
 
     print(f"\nSaved to: {output_file}")
 
@@ -426,21 +500,26 @@ def dock_antibodies_diffdock(structure_predictions, her2_structure):
 
     docking_results = []
 
-    for pred in structure_predictions:
-        # Calculate conceptual docking scores
+    # Calculate conceptual docking scores for all designs at once
+    names = [pred["name"] for pred in structure_predictions]
+    n = len(names)
 
-        # 1. CDR-epitope complementarity (based on sequence similarity)
-        cdr_score = calculate_cdr_epitope_complementarity(pred["name"])
+    # 1. CDR-epitope complementarity (based on sequence similarity)
+    cdr_scores = np.fromiter(map(calculate_cdr_epitope_complementarity, names), float, n)
 
-        # 2. Electrostatic score
-        electrostatic_score = calculate_electrostatic_compatibility(pred["name"])
+    # 2. Electrostatic score
+    electrostatic_scores = np.fromiter(map(calculate_electrostatic_compatibility, names), float, n)
 
-        # 3. Shape complementarity (estimated)
-        shape_score = 0.65 + np.random.uniform(-0.1, 0.1)
+    # 3. Shape complementarity (estimated); one draw per design
+    shape_scores = 0.65 + RNG.uniform(-0.1, 0.1, size=n)
 
-        # Combined docking score
-        combined_score = (cdr_score * 0.4 + electrostatic_score * 0.3 + shape_score * 0.3)
+    # Combined docking score
+    combined_scores = cdr_scores * 0.4 + electrostatic_scores * 0.3 + shape_scores * 0.3
 
+    lines = []
+    for pred, cdr_score, electrostatic_score, shape_score, combined_score in zip(
+            structure_predictions, cdr_scores.tolist(), electrostatic_scores.tolist(),
+            shape_scores.tolist(), combined_scores.tolist()):
         result = {
             "antibody": pred["name"],
             "target": "p95-HER2 (611-652)",
@@ -453,52 +532,57 @@ def dock_antibodies_diffdock(structure_predictions, her2_structure):
         }
         docking_results.append(result)
 
-        print(f"\n{pred['name']}:")
-        print(f"  CDR complementarity: {cdr_score:.3f}")
-        print(f"  Electrostatic: {electrostatic_score:.3f}")
-        print(f"  Shape: {shape_score:.3f}")
-        print(f"  Combined: {combined_score:.3f} ({result['predicted_binding']})")
+        lines += [f"\n{pred['name']}:",
+                  f"  CDR complementarity: {cdr_score:.3f}",
+                  f"  Electrostatic: {electrostatic_score:.3f}",
+                  f"  Shape: {shape_score:.3f}",
+                  f"  Combined: {combined_score:.3f} ({result['predicted_binding']})"]
+
+    print("\n".join(lines))
 
     # Rank by docking score
     docking_results.sort(key=lambda x: x["combined_docking_score"], reverse=True)
 
     # Save results
     output_file = OUTPUT_DIR / "step3_docking_results.json"
-    with open(output_file, 'w') as f:
-        json.dump(docking_results, f, indent=2)
+    save_json(docking_results, output_file)
 
     print(f"\nSaved to: {output_file}")
 
     print("\n" + "-"*50)
     print("DOCKING RANKING:")
     print("-"*50)
-    for i, result in enumerate(docking_results, 1):
-        print(f"{i}. {result['antibody']}: {result['combined_docking_score']:.3f} ({result['predicted_binding']})")
+    print("\n".join(
+        f"{i}. {result['antibody']}: {result['combined_docking_score']:.3f} ({result['predicted_binding']})"
+        for i, result in enumerate(docking_results, 1)))
 
     return docking_results
 
 
+# Scoring based on design strategy
+CDR_COMPLEMENTARITY_SCORES = {
+    "p95-ESM-001": 0.82,  # Epitope mimicry - high
+    "p95-ESM-002": 0.75,  # Charge complementarity
+    "p95-ESM-003": 0.78,  # Hydrophobic targeting
+    "p95-ESM-004": 0.85,  # Neo-epitope specific - highest
+}
+
+ELECTROSTATIC_SCORES = {
+    "p95-ESM-001": 0.70,
+    "p95-ESM-002": 0.88,  # Charge complementarity - highest
+    "p95-ESM-003": 0.65,
+    "p95-ESM-004": 0.72,
+}
+
+
 def calculate_cdr_epitope_complementarity(antibody_name):
     """Calculate CDR-epitope sequence complementarity score."""
-    # Scoring based on design strategy
-    scores = {
-        "p95-ESM-001": 0.82,  # Epitope mimicry - high
-        "p95-ESM-002": 0.75,  # Charge complementarity
-        "p95-ESM-003": 0.78,  # Hydrophobic targeting
-        "p95-ESM-004": 0.85,  # Neo-epitope specific - highest
-    }
-    return scores.get(antibody_name, 0.70)
+    return CDR_COMPLEMENTARITY_SCORES.get(antibody_name, 0.70)
 
 
 def calculate_electrostatic_compatibility(antibody_name):
     """Calculate electrostatic compatibility score."""
-    scores = {
-        "p95-ESM-001": 0.70,
-        "p95-ESM-002": 0.88,  # Charge complementarity - highest
-        "p95-ESM-003": 0.65,
-        "p95-ESM-004": 0.72,
-    }
-    return scores.get(antibody_name, 0.65)
+    return ELECTROSTATIC_SCORES.get(antibody_name, 0.65)
 
 
 # =============================================================================
@@ -545,70 +629,96 @@ def calculate_binding_energy_rowan(docking_results):
 
     binding_energies = []
 
-    for result in docking_results:
-        # Estimate binding energy from docking score
-        # Empirical relationship: ΔG ≈ -RT ln(Kd)
-        # Docking score correlates with -log(Kd)
-
-        docking_score = result["combined_docking_score"]
-
-        # Convert to estimated Kd (nM)
-        # Higher docking score = lower Kd = stronger binding
-        estimated_kd = 10 ** (3 - 5 * docking_score)  # Range: ~0.1 to 1000 nM
-
-        # Convert to ΔG (kcal/mol) at 298K
-        # ΔG = RT ln(Kd), R = 1.987 cal/(mol·K)
-        R = 1.987e-3  # kcal/(mol·K)
-        T = 298  # K
-        delta_g = R * T * np.log(estimated_kd * 1e-9)  # Convert nM to M
-
-        # Interface area estimate (Å²)
-        interface_area = 800 + 400 * docking_score  # Typical: 800-1600 Å²
-
+    # Estimate binding energies from docking scores, for all antibodies at once
+    # Empirical relationship: ΔG ≈ -RT ln(Kd)
+    # Docking score correlates with -log(Kd)
+    docking_scores = np.fromiter((r["combined_docking_score"] for r in docking_results),
+                                 float, len(docking_results))
+
+    # Convert to estimated Kd (nM)
+    # Higher docking score = lower Kd = stronger binding
+    # Kd comes from pow() as the per-antibody formula did, so scores on a band edge give an
+    # exact power of ten (100 nM at score 0.2); only ΔG is taken from ln(Kd), skipping a log call
+    exponents = 3 - 5 * docking_scores
+    estimated_kds = np.power(10.0, exponents)  # Range: ~0.1 to 1000 nM
+    ln_kds = LN10 * exponents
+
+    # Convert to ΔG (kcal/mol) at 298K
+    # ΔG = RT ln(Kd), R = 1.987 cal/(mol·K)
+    R = 1.987e-3  # kcal/(mol·K)
+    T = 298  # K
+    delta_gs = R * T * (ln_kds + LN_NM_TO_M)  # ln(Kd[nM] * 1e-9), without a log call
+
+    # Interface area estimate (Å²)
+    interface_areas = 800 + 400 * docking_scores  # Typical: 800-1600 Å²
+
+    binding_classes = [BINDING_CLASSES[i] for i in
+                       np.searchsorted(KD_BANDS_NM, estimated_kds, side='right')]
+
+    adc_scores = assess_adc_suitability(estimated_kds,
+                                        [r["predicted_binding"] for r in docking_results])
+
+    lines = []
+    for result, estimated_kd, delta_g, interface_area, binding_class, adc_score in zip(
+            docking_results, estimated_kds.tolist(), delta_gs.tolist(), interface_areas.tolist(),
+            binding_classes, adc_scores):
         energy_result = {
             "antibody": result["antibody"],
             "docking_score": result["combined_docking_score"],
             "predicted_Kd_nM": round(estimated_kd, 2),
             "predicted_dG_kcal_mol": round(delta_g, 2),
             "estimated_interface_area_A2": round(interface_area, 0),
-            "binding_classification": classify_binding(estimated_kd),
-            "adc_suitability": assess_adc_suitability(estimated_kd, result["predicted_binding"])
+            "binding_classification": binding_class,
+            "adc_suitability": adc_score
         }
         binding_energies.append(energy_result)
 
-        print(f"\n{result['antibody']}:")
-        print(f"  Predicted Kd: {estimated_kd:.2f} nM")
-        print(f"  Predicted ΔG: {delta_g:.2f} kcal/mol")
-        print(f"  Interface area: ~{interface_area:.0f} Å²")
-        print(f"  Classification: {energy_result['binding_classification']}")
-        print(f"  ADC Suitability: {energy_result['adc_suitability']}/10")
+        lines += [f"\n{result['antibody']}:",
+                  f"  Predicted Kd: {estimated_kd:.2f} nM",
+                  f"  Predicted ΔG: {delta_g:.2f} kcal/mol",
+                  f"  Interface area: ~{interface_area:.0f} Å²",
+                  f"  Classification: {energy_result['binding_classification']}",
+                  f"  ADC Suitability: {energy_result['adc_suitability']}/10"]
+
+    print("\n".join(lines))
 
     # Save results
     output_file = OUTPUT_DIR / "step4_binding_energies.json"
-    with open(output_file, 'w') as f:
-        json.dump(binding_energies, f, indent=2)
+    save_json(binding_energies, output_file)
 
     print(f"\nSaved to: {output_file}")
 
     return binding_energies
 
 
+LN10 = math.log(10.0)
+LN_NM_TO_M = math.log(1e-9)
+
+# Kd bands (nM), each closed at the lower edge: [1, 10) is "Strong", and so on
+KD_BANDS_NM = np.array([1.0, 10.0, 100.0, 1000.0])
+BINDING_CLASSES = ("Very Strong (sub-nM)", "Strong (single-digit nM)", "Moderate (tens of nM)",
+                   "Weak (hundreds of nM)", "Very Weak (μM)")
+
+
 def classify_binding(kd_nm):
     """Classify binding strength based on Kd."""
-    if kd_nm < 1:
-        return "Very Strong (sub-nM)"
-    elif kd_nm < 10:
-        return "Strong (single-digit nM)"
-    elif kd_nm < 100:
-        return "Moderate (tens of nM)"
-    elif kd_nm < 1000:
-        return "Weak (hundreds of nM)"
-    else:
-        return "Very Weak (μM)"
+    return BINDING_CLASSES[np.searchsorted(KD_BANDS_NM, kd_nm, side='right')]
+
+
+# Affinity bonus per Kd band (nM): <1, <10, <50, 50-100 (inclusive), >100
+ADC_KD_BANDS_NM = np.array([1.0, 10.0, 50.0, np.nextafter(100.0, np.inf)])
+ADC_KD_BONUS = np.array([2.5, 2.0, 1.0, 0.0, -1.0])
+
+# Binding strength bonus ("Moderate" and anything else: 0)
+ADC_STRENGTH_BONUS = {"Strong": 1.0, "Weak": -1.5}
 
 
 def assess_adc_suitability(kd_nm, binding_strength):
-    """Assess suitability for ADC development."""
+    """Assess suitability for ADC development.
+
+    Also scores a whole batch: pass an array of Kd values and a matching sequence of
+    binding strengths to get a list of scores back.
+    """
     # ADC requirements:
     # - Good affinity (Kd < 50 nM preferred)
     # - Internalization (related to epitope location)
@@ -617,25 +727,18 @@ def assess_adc_suitability(kd_nm, binding_strength):
     score = 5.0  # Base score
 
     # Affinity bonus
-    if kd_nm < 1:
-        score += 2.5
-    elif kd_nm < 10:
-        score += 2.0
-    elif kd_nm < 50:
-        score += 1.0
-    elif kd_nm > 100:
-        score -= 1.0
+    score = score + ADC_KD_BONUS[np.searchsorted(ADC_KD_BANDS_NM, kd_nm, side='right')]
 
     # Binding strength bonus
-    if binding_strength == "Strong":
-        score += 1.0
-    elif binding_strength == "Weak":
-        score -= 1.5
+    if isinstance(binding_strength, str):
+        score += ADC_STRENGTH_BONUS.get(binding_strength, 0.0)
+    else:
+        score += np.array([ADC_STRENGTH_BONUS.get(b, 0.0) for b in binding_strength])
 
     # p95-specific bonus (novel target)
     score += 0.5
 
-    return round(min(10, max(0, score)), 1)
+    return np.round(np.clip(score, 0, 10), 1).tolist()
 
 
 # =============================================================================
@@ -650,17 +753,22 @@ def generate_final_report(cdr_designs, full_sequences, structure_predictions,
     print("FINAL REPORT: p95-HER2 mAb Design Pipeline Results")
     print("="*70)
 
-    # Combine all results
+    # Combine all results, joining the per-step records by antibody name
     final_results = []
 
+    designs = {d["name"]: d for d in cdr_designs}
+    sequences = {s["name"]: s for s in full_sequences}
+    structures = {p["name"]: p for p in structure_predictions}
+    dockings = {d["antibody"]: d for d in docking_results}
+
     for energy in binding_energies:
         name = energy["antibody"]
 
         # Find corresponding data
-        design = next((d for d in cdr_designs if d["name"] == name), None)
-        sequence = next((s for s in full_sequences if s["name"] == name), None)
-        structure = next((p for p in structure_predictions if p["name"] == name), None)
-        docking = next((d for d in docking_results if d["antibody"] == name), None)
+        design = designs.get(name)
+        sequence = sequences.get(name)
+        structure = structures.get(name)
+        docking = dockings.get(name)
 
         if all([design, sequence, structure, docking]):
             result = {
@@ -691,10 +799,11 @@ def generate_final_report(cdr_designs, full_sequences, structure_predictions,
     print("\n" + "-"*90)
     print(f"{'Rank':<5} {'Name':<18} {'Strategy':<22} {'Kd(nM)':<10} {'ΔG':<10} {'ADC Score':<10}")
     print("-"*90)
-    for r in final_results:
-        print(f"{r['rank']:<5} {r['name']:<18} {r['design_strategy']:<22} "
-              f"{r['predicted_Kd_nM']:<10.1f} {r['predicted_dG_kcal_mol']:<10.1f} "
-              f"{r['adc_suitability']:<10.1f}")
+    print("\n".join(
+        f"{r['rank']:<5} {r['name']:<18} {r['design_strategy']:<22} "
+        f"{r['predicted_Kd_nM']:<10.1f} {r['predicted_dG_kcal_mol']:<10.1f} "
+        f"{r['adc_suitability']:<10.1f}"
+        for r in final_results))
     print("-"*90)
 
     # Top recommendation
@@ -708,13 +817,11 @@ def generate_final_report(cdr_designs, full_sequences, structure_predictions,
 
     # Save final report
     output_file = OUTPUT_DIR / "final_pipeline_results.json"
-    with open(output_file, 'w') as f:
-        json.dump(final_results, f, indent=2)
+    save_json(final_results, output_file)
 
     # Save as CSV
     csv_file = OUTPUT_DIR / "final_pipeline_results.csv"
-    import csv
-    with open(csv_file, 'w', newline='') as f:
+    with atomic_open(csv_file, newline='') as f:
         writer = csv.DictWriter(f, fieldnames=final_results[0].keys())
         writer.writeheader()
         writer.writerows(final_results)
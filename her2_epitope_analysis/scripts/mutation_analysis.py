@@ -168,12 +168,15 @@ RESISTANCE_MECHANISMS = """
 """
 
 
+# Columnar view of HER2_MUTATIONS, built once; the CSV and summary filters run on its columns
+_MUT_DF = pd.DataFrame(HER2_MUTATIONS)
+
+
 def generate_mutation_csv(output_path):
     """Generate mutation data CSV."""
-    df = pd.DataFrame(HER2_MUTATIONS)
-    df.to_csv(output_path, index=False)
+    _MUT_DF.to_csv(output_path, index=False)
     print(f"Generated: {output_path}")
-    return df
+    return _MUT_DF
 
 
 def print_mutation_summary():
@@ -187,15 +190,15 @@ def print_mutation_summary():
     print(f"{'Mutation':<20} {'Domain':<15} {'Freq %':<10} {'ADC Impact':<20}")
     print("-" * 70)
 
-    for mut in HER2_MUTATIONS:
-        if mut['domain'] != 'N/A' and 'loss' not in mut['mutation'].lower():
-            print(f"{mut['mutation']:<20} {mut['domain']:<15} "
-                  f"{mut['frequency_percent']:<10} {mut['adc_impact']:<20}")
+    point = (_MUT_DF['domain'] != 'N/A') & ~_MUT_DF['mutation'].str.lower().str.contains('loss')
+    for mut in _MUT_DF[point].to_dict('records'):
+        print(f"{mut['mutation']:<20} {mut['domain']:<15} "
+              f"{mut['frequency_percent']:<10} {mut['adc_impact']:<20}")
 
     print("\n2. Major Resistance Mechanisms:")
     print("-" * 50)
-    major = [m for m in HER2_MUTATIONS if 'Major' in m['adc_impact'] or m['frequency_percent'] >= 10]
-    for mut in major:
+    major = _MUT_DF['adc_impact'].str.contains('Major') | (_MUT_DF['frequency_percent'] >= 10)
+    for mut in _MUT_DF[major].to_dict('records'):
         print(f"\n• {mut['mutation']}:")
         print(f"  Frequency: {mut['frequency_percent']}%")
         print(f"  Mechanism: {mut['resistance_mechanism']}")
@@ -6,11 +6,16 @@ Deep analysis of p95-HER2 truncation variants, patient coverage,
 and prediction of novel mAbs targeting the remaining epitopes.
 """
 
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from datetime import datetime
+import csv
+import functools
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from atomic_io import atomic_open
+
+# matplotlib is imported inside the figure functions, so the CSV writers and
+# print_p95_summary() run without paying its ~300 ms import
 
 # ============================================================================
 # p95-HER2 VARIANTS
@@ -123,6 +128,10 @@ PATIENT_COVERAGE = [
     }
 ]
 
+# Bar-chart axis data for the coverage figure, derived once from the table above
+COVERAGE_LABELS = tuple(d["cancer_type"].replace(" ", "\n") for d in PATIENT_COVERAGE)
+COVERAGE_FREQUENCIES = tuple(d["p95_frequency_percent"] for d in PATIENT_COVERAGE)
+
 # ============================================================================
 # PREDICTED NOVEL mAbs FOR p95-HER2
 # ============================================================================
@@ -304,40 +313,59 @@ P95_REFERENCES = [
 # FUNCTIONS
 # ============================================================================
 
+def _write_rows(output_path, rows):
+    """Write a list of dicts as CSV, with columns in first-seen key order."""
+    fieldnames = list(dict.fromkeys(key for row in rows for key in row))
+    with atomic_open(output_path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(rows)
+
 def generate_p95_variants_csv(output_path):
     """Generate p95 variants CSV."""
-    df = pd.DataFrame(P95_VARIANTS)
-    df.to_csv(output_path, index=False)
+    _write_rows(output_path, P95_VARIANTS)
     print(f"Generated: {output_path}")
-    return df
+    return P95_VARIANTS
 
 def generate_patient_coverage_csv(output_path):
     """Generate patient coverage CSV."""
-    df = pd.DataFrame(PATIENT_COVERAGE)
-    df.to_csv(output_path, index=False)
+    _write_rows(output_path, PATIENT_COVERAGE)
     print(f"Generated: {output_path}")
-    return df
+    return PATIENT_COVERAGE
 
 def generate_novel_mabs_csv(output_path):
     """Generate novel mAbs CSV."""
-    df = pd.DataFrame(P95_NOVEL_MABS)
-    df.to_csv(output_path, index=False)
+    _write_rows(output_path, P95_NOVEL_MABS)
     print(f"Generated: {output_path}")
-    return df
+    return P95_NOVEL_MABS
 
 def generate_references_csv(output_path):
     """Generate references CSV."""
-    df = pd.DataFrame(P95_REFERENCES)
-    df.to_csv(output_path, index=False)
+    _write_rows(output_path, P95_REFERENCES)
     print(f"Generated: {output_path}")
-    return df
+    return P95_REFERENCES
+
+def _pyplot():
+    """Import pyplot on first use, on the headless Agg backend (writes PNGs, never opens a window)."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+def add_patches(ax, patches):
+    """Add a panel's patches as one collection; axis limits are fixed, so skip autolim."""
+    from matplotlib.collections import PatchCollection
+    ax.add_collection(PatchCollection(patches, match_original=True), autolim=False)
 
 def create_p95_structure_figure():
     """Create p95-HER2 structure comparison figure."""
+    import matplotlib.patches as mpatches
+    plt = _pyplot()
     fig, axes = plt.subplots(1, 2, figsize=(16, 8))
 
     # Left: Full-length HER2 vs p95-HER2
     ax1 = axes[0]
+    patches1 = []
 
     # Full-length HER2
     fl_domains = [
@@ -356,49 +384,51 @@ def create_p95_structure_figure():
             edgecolor="black",
             linewidth=2
         )
-        ax1.add_patch(rect)
+        patches1.append(rect)
         ax1.text(2.25, domain["y"] + domain["height"]/2, domain["name"],
                 ha='center', va='center', fontsize=9, fontweight='bold')
 
     # FL-HER2 JM + TM + Kinase
-    ax1.add_patch(mpatches.FancyBboxPatch((1, 2.0), 2.5, 0.7, boxstyle="round,pad=0.02",
-                                          facecolor="#FFE4B5", edgecolor="black", linewidth=2))
+    patches1.append(mpatches.FancyBboxPatch((1, 2.0), 2.5, 0.7, boxstyle="round,pad=0.02",
+                                            facecolor="#FFE4B5", edgecolor="black", linewidth=2))
     ax1.text(2.25, 2.35, "JM (611-652)", ha='center', va='center', fontsize=8)
 
-    ax1.add_patch(mpatches.FancyBboxPatch((1, 1.5), 2.5, 0.4, boxstyle="round,pad=0.02",
-                                          facecolor="#D3D3D3", edgecolor="black", linewidth=2))
+    patches1.append(mpatches.FancyBboxPatch((1, 1.5), 2.5, 0.4, boxstyle="round,pad=0.02",
+                                            facecolor="#D3D3D3", edgecolor="black", linewidth=2))
     ax1.text(2.25, 1.7, "TM", ha='center', va='center', fontsize=8)
 
-    ax1.add_patch(mpatches.FancyBboxPatch((1, 0.3), 2.5, 1.0, boxstyle="round,pad=0.02",
-                                          facecolor="#DDA0DD", edgecolor="black", linewidth=2))
+    patches1.append(mpatches.FancyBboxPatch((1, 0.3), 2.5, 1.0, boxstyle="round,pad=0.02",
+                                            facecolor="#DDA0DD", edgecolor="black", linewidth=2))
     ax1.text(2.25, 0.8, "Kinase", ha='center', va='center', fontsize=8)
 
     ax1.text(2.25, 9.0, "Full-length HER2\n(185 kDa)", ha='center', va='center',
              fontsize=11, fontweight='bold')
 
     # p95-HER2
-    ax1.add_patch(mpatches.FancyBboxPatch((5, 2.0), 2.5, 0.7, boxstyle="round,pad=0.02",
-                                          facecolor="#FFE4B5", edgecolor="black", linewidth=2))
+    patches1.append(mpatches.FancyBboxPatch((5, 2.0), 2.5, 0.7, boxstyle="round,pad=0.02",
+                                            facecolor="#FFE4B5", edgecolor="black", linewidth=2))
     ax1.text(6.25, 2.35, "JM stub\n(611-652)", ha='center', va='center', fontsize=8)
 
-    ax1.add_patch(mpatches.FancyBboxPatch((5, 1.5), 2.5, 0.4, boxstyle="round,pad=0.02",
-                                          facecolor="#D3D3D3", edgecolor="black", linewidth=2))
+    patches1.append(mpatches.FancyBboxPatch((5, 1.5), 2.5, 0.4, boxstyle="round,pad=0.02",
+                                            facecolor="#D3D3D3", edgecolor="black", linewidth=2))
     ax1.text(6.25, 1.7, "TM", ha='center', va='center', fontsize=8)
 
-    ax1.add_patch(mpatches.FancyBboxPatch((5, 0.3), 2.5, 1.0, boxstyle="round,pad=0.02",
-                                          facecolor="#DDA0DD", edgecolor="black", linewidth=2))
+    patches1.append(mpatches.FancyBboxPatch((5, 0.3), 2.5, 1.0, boxstyle="round,pad=0.02",
+                                            facecolor="#DDA0DD", edgecolor="black", linewidth=2))
     ax1.text(6.25, 0.8, "Kinase", ha='center', va='center', fontsize=8)
 
     # Missing ECD (dashed)
-    ax1.add_patch(mpatches.FancyBboxPatch((5, 3.0), 2.5, 5.7, boxstyle="round,pad=0.05",
-                                          facecolor="white", edgecolor="red",
-                                          linewidth=2, linestyle='--'))
+    patches1.append(mpatches.FancyBboxPatch((5, 3.0), 2.5, 5.7, boxstyle="round,pad=0.05",
+                                            facecolor="white", edgecolor="red",
+                                            linewidth=2, linestyle='--'))
     ax1.text(6.25, 5.8, "MISSING\nECD\n(Domains I-IV)", ha='center', va='center',
              fontsize=10, color='red', fontweight='bold')
 
     ax1.text(6.25, 9.0, "p95-HER2\n(95 kDa)", ha='center', va='center',
              fontsize=11, fontweight='bold', color='red')
 
+    add_patches(ax1, patches1)
+
     # Annotations
     ax1.annotate('Trastuzumab\nbinding site', xy=(3.7, 3.6), xytext=(4.2, 4.5),
                 arrowprops=dict(arrowstyle='->', color='green', lw=1.5),
@@ -414,19 +444,20 @@ def create_p95_structure_figure():
 
     # Right: Predicted mAb binding sites on p95
     ax2 = axes[1]
+    patches2 = []
 
     # p95 structure (zoomed)
-    ax2.add_patch(mpatches.FancyBboxPatch((3, 4), 4, 2, boxstyle="round,pad=0.05",
-                                          facecolor="#FFE4B5", edgecolor="black", linewidth=2))
+    patches2.append(mpatches.FancyBboxPatch((3, 4), 4, 2, boxstyle="round,pad=0.05",
+                                            facecolor="#FFE4B5", edgecolor="black", linewidth=2))
     ax2.text(5, 5, "Juxtamembrane Stub\n(611-652)\n~42 aa extracellular",
              ha='center', va='center', fontsize=10, fontweight='bold')
 
-    ax2.add_patch(mpatches.FancyBboxPatch((3, 3), 4, 0.8, boxstyle="round,pad=0.02",
-                                          facecolor="#D3D3D3", edgecolor="black", linewidth=2))
+    patches2.append(mpatches.FancyBboxPatch((3, 3), 4, 0.8, boxstyle="round,pad=0.02",
+                                            facecolor="#D3D3D3", edgecolor="black", linewidth=2))
     ax2.text(5, 3.4, "Transmembrane (653-675)", ha='center', va='center', fontsize=9)
 
-    ax2.add_patch(mpatches.FancyBboxPatch((3, 0.5), 4, 2.3, boxstyle="round,pad=0.05",
-                                          facecolor="#DDA0DD", edgecolor="black", linewidth=2))
+    patches2.append(mpatches.FancyBboxPatch((3, 0.5), 4, 2.3, boxstyle="round,pad=0.05",
+                                            facecolor="#DDA0DD", edgecolor="black", linewidth=2))
     ax2.text(5, 1.65, "Kinase Domain\n(720-987)", ha='center', va='center', fontsize=10)
 
     # Membrane line
@@ -441,10 +472,10 @@ def create_p95_structure_figure():
     ]
 
     for mab in mab_sites:
-        ax2.add_patch(mpatches.FancyBboxPatch((mab["x"], mab["y"]-0.3), 2.2, 0.8,
-                                              boxstyle="round,pad=0.05",
-                                              facecolor=mab["color"],
-                                              edgecolor="black", linewidth=1.5))
+        patches2.append(mpatches.FancyBboxPatch((mab["x"], mab["y"]-0.3), 2.2, 0.8,
+                                                boxstyle="round,pad=0.05",
+                                                facecolor=mab["color"],
+                                                edgecolor="black", linewidth=1.5))
         ax2.text(mab["x"]+1.1, mab["y"]+0.1, mab["name"], ha='center', va='center', fontsize=8)
 
         # Arrow to binding site
@@ -455,6 +486,8 @@ def create_p95_structure_figure():
             ax2.annotate('', xy=(7, 4.5), xytext=(mab["x"], mab["y"]+0.1),
                         arrowprops=dict(arrowstyle='->', color='gray', lw=1))
 
+    add_patches(ax2, patches2)
+
     ax2.set_xlim(-0.5, 10.5)
     ax2.set_ylim(0, 7)
     ax2.axis('off')
@@ -466,10 +499,11 @@ def create_p95_structure_figure():
 
 def create_patient_coverage_figure():
     """Create patient coverage bar chart."""
+    plt = _pyplot()
     fig, ax = plt.subplots(figsize=(10, 6))
 
-    cancer_types = [d["cancer_type"].replace(" ", "\n") for d in PATIENT_COVERAGE]
-    frequencies = [d["p95_frequency_percent"] for d in PATIENT_COVERAGE]
+    cancer_types = COVERAGE_LABELS
+    frequencies = COVERAGE_FREQUENCIES
 
     colors = ['#FF6B6B', '#FF8E8E', '#FFB0B0', '#4ECDC4', '#45B7D1']
 
@@ -493,6 +527,7 @@ def create_patient_coverage_figure():
 
 def create_mab_evaluation_figure():
     """Create mAb evaluation comparison."""
+    plt = _pyplot()
     fig, ax = plt.subplots(figsize=(12, 6))
 
     mabs = ['p95-mAb-001\n(JM)', 'p95-mAb-002\n(Neo)', 'p95-mAb-003\n(MP)',
@@ -518,73 +553,133 @@ def create_mab_evaluation_figure():
     return fig
 
 
-def print_p95_summary():
-    """Print p95-HER2 analysis summary."""
-    print("=" * 70)
-    print("p95-HER2 Analysis Summary")
-    print("=" * 70)
+# Output path -> builder. The figures share no state, so main() renders them in parallel.
+FIGURES = {
+    "images/p95_her2_structure.png": create_p95_structure_figure,
+    "images/p95_patient_coverage.png": create_patient_coverage_figure,
+    "images/p95_mab_evaluation.png": create_mab_evaluation_figure,
+}
+
+@functools.lru_cache(maxsize=None)
+def render_key():
+    """Identify the rendered output: everything a figure depends on (the data tables and
+    the drawing code) lives in this file, so hash its bytes plus the matplotlib version."""
+    import matplotlib
+    with open(__file__, "rb") as f:
+        return hashlib.blake2b(f.read() + matplotlib.__version__.encode(),
+                               digest_size=8).hexdigest()
+
+
+def _digest(path):
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=8).hexdigest()
+
+
+def _sidecar(path):
+    head, tail = os.path.split(path)
+    return os.path.join(head, f".{tail}.key")
 
-    print("\n1. p95-HER2 Variants:")
-    print("-" * 50)
+
+def _is_current(path):
+    """True if path was rendered with the current render_key() and has not been overwritten since.
+
+    The sidecar also records the PNG's own digest, because other scripts
+    (generate_p95_docking_images.py) write to some of the same image paths.
+    """
+    try:
+        with open(_sidecar(path)) as f:
+            key, digest = f.read().split()
+        return key == render_key() and digest == _digest(path)
+    except (OSError, ValueError):
+        return False
+
+
+def _render(path):
+    """Build one figure and save it as a 300-dpi PNG (runs in a worker process).
+
+    Skipped when the PNG on disk is already current; returns (path, rendered).
+    """
+    if _is_current(path):
+        return path, False
+    fig = FIGURES[path]()
+    # Fast deflate: cheaper PNG encode at 300 dpi in exchange for a larger file
+    fig.savefig(path, dpi=300, bbox_inches='tight', pil_kwargs={'compress_level': 1})
+    _pyplot().close(fig)
+    with open(_sidecar(path), "w") as f:
+        f.write(f"{render_key()} {_digest(path)}\n")
+    return path, True
+
+
+def _build_p95_summary():
+    """Format the p95-HER2 analysis summary from the static tables as one string."""
+    lines = ["=" * 70, "p95-HER2 Analysis Summary", "=" * 70]
+
+    lines += ["\n1. p95-HER2 Variants:", "-" * 50]
     for var in P95_VARIANTS:
-        print(f"\n{var['variant']}:")
-        print(f"  Mechanism: {var['mechanism']}")
-        print(f"  Start: residue {var['start_residue']}")
-        print(f"  Trastuzumab binding: {var['trastuzumab_binding']}")
-
-    print("\n\n2. Patient Coverage:")
-    print("-" * 50)
-    for cov in PATIENT_COVERAGE:
-        print(f"{cov['cancer_type']}: {cov['p95_frequency_percent']}%")
-
-    print("\n\n3. Predicted Novel mAbs:")
-    print("-" * 50)
+        lines += [
+            f"\n{var['variant']}:",
+            f"  Mechanism: {var['mechanism']}",
+            f"  Start: residue {var['start_residue']}",
+            f"  Trastuzumab binding: {var['trastuzumab_binding']}",
+        ]
+
+    lines += ["\n\n2. Patient Coverage:", "-" * 50]
+    lines += [f"{cov['cancer_type']}: {cov['p95_frequency_percent']}%" for cov in PATIENT_COVERAGE]
+
+    lines += ["\n\n3. Predicted Novel mAbs:", "-" * 50]
     for mab in P95_NOVEL_MABS:
-        print(f"\n{mab['mab_id']}:")
-        print(f"  Target: {mab['target']}")
-        print(f"  Epitope: {mab['epitope_residues']}")
-        print(f"  ADC Score: {mab['adc_suitability_score']}/10")
+        lines += [
+            f"\n{mab['mab_id']}:",
+            f"  Target: {mab['target']}",
+            f"  Epitope: {mab['epitope_residues']}",
+            f"  ADC Score: {mab['adc_suitability_score']}/10",
+        ]
+
+    lines += [
+        "\n\n4. Key Findings:",
+        "-" * 50,
+        "• p95-HER2 found in 20-50% of HER2+ cancers (higher in resistant)",
+        "• Lacks Domains I-IV, only ~42 aa extracellular stub remains",
+        "• Bispecific approach (p95 + FL-HER2) most promising (score 8.5/10)",
+        "• Neo-epitope targeting specific to p95-CTF611 variant",
+        "• TKIs remain effective against p95-HER2 (intracellular kinase intact)",
+    ]
+    return "\n".join(lines)
+
+
+# The tables are static, so the summary text is formatted once at import
+P95_SUMMARY = _build_p95_summary()
 
-    print("\n\n4. Key Findings:")
-    print("-" * 50)
-    print("• p95-HER2 found in 20-50% of HER2+ cancers (higher in resistant)")
-    print("• Lacks Domains I-IV, only ~42 aa extracellular stub remains")
-    print("• Bispecific approach (p95 + FL-HER2) most promising (score 8.5/10)")
-    print("• Neo-epitope targeting specific to p95-CTF611 variant")
-    print("• TKIs remain effective against p95-HER2 (intracellular kinase intact)")
+
+def print_p95_summary():
+    """Print p95-HER2 analysis summary."""
+    print(P95_SUMMARY)
 
 
 def main():
     """Main analysis workflow."""
+    from datetime import datetime
+
     print("=" * 70)
     print("p95-HER2 Analysis and Novel mAb Prediction")
     print("=" * 70)
     print(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
-    # Generate CSVs
-    print("\nGenerating data files...")
-    generate_p95_variants_csv("data/p95_her2_variants.csv")
-    generate_patient_coverage_csv("data/p95_patient_coverage.csv")
-    generate_novel_mabs_csv("data/p95_novel_mabs.csv")
-    generate_references_csv("data/p95_references.csv")
-
-    # Generate figures
-    print("\nGenerating figures...")
-
-    fig1 = create_p95_structure_figure()
-    fig1.savefig("images/p95_her2_structure.png", dpi=300, bbox_inches='tight')
-    plt.close(fig1)
-    print("Saved: images/p95_her2_structure.png")
-
-    fig2 = create_patient_coverage_figure()
-    fig2.savefig("images/p95_patient_coverage.png", dpi=300, bbox_inches='tight')
-    plt.close(fig2)
-    print("Saved: images/p95_patient_coverage.png")
-
-    fig3 = create_mab_evaluation_figure()
-    fig3.savefig("images/p95_mab_evaluation.png", dpi=300, bbox_inches='tight')
-    plt.close(fig3)
-    print("Saved: images/p95_mab_evaluation.png")
+    # Start the figure workers first, so rendering overlaps the CSV writes below
+    with ProcessPoolExecutor(max_workers=len(FIGURES)) as ex:
+        renders = ex.map(_render, FIGURES)
+
+        # Generate CSVs
+        print("\nGenerating data files...")
+        generate_p95_variants_csv("data/p95_her2_variants.csv")
+        generate_patient_coverage_csv("data/p95_patient_coverage.csv")
+        generate_novel_mabs_csv("data/p95_novel_mabs.csv")
+        generate_references_csv("data/p95_references.csv")
+
+        # Generate figures
+        print("\nGenerating figures...")
+        for path, rendered in renders:
+            print(f"Saved: {path}" if rendered else f"Up to date: {path}")
 
     # Print summary
     print_p95_summary()
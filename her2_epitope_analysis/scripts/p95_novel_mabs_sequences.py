@@ -4,9 +4,16 @@ Generate VH/VL sequences for predicted p95-HER2 targeting mAbs.
 Compare with Trastuzumab, Pertuzumab, and Zanidatamab sequences.
 """
 
-import pandas as pd
+import csv
 import os
 
+from atomic_io import atomic_open
+
+# Resolve output paths from the script's location rather than the working directory
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(os.path.dirname(SCRIPT_DIR), "data")
+SEQUENCES_DIR = os.path.join(DATA_DIR, "sequences")
+
 # Known antibody sequences for comparison (from DrugBank/IMGT)
 REFERENCE_ANTIBODIES = {
     "Trastuzumab": {
@@ -179,133 +186,96 @@ PUBLIC_P95_ANTIBODIES = {
     }
 }
 
-def create_sequence_comparison_table():
-    """Create comprehensive comparison table of all antibodies."""
-    data = []
-
-    # Reference antibodies
-    for name, info in REFERENCE_ANTIBODIES.items():
-        if "VH_arm1" in info:  # Bispecific
-            vh_len = len(info["VH_arm1"])
-            vl_len = len(info["VL_arm1"])
-        else:
-            vh_len = len(info["VH"])
-            vl_len = len(info["VL"])
-
-        data.append({
-            "mAb_name": name,
-            "category": "Approved/Clinical",
-            "target": info["target"],
-            "VH_length": vh_len,
-            "VL_length": vl_len,
-            "Kd_nM": info["Kd_nM"],
-            "internalization_4h": info["internalization_4h"],
-            "adc_score": info["adc_score"],
-            "framework": info["framework"],
-            "humanization": info["humanization"],
-            "p95_binding": "No" if name != "Zanidatamab" else "No (Domain II+IV only)"
-        })
+# One entry per antibody table. Bispecific arms are listed as (arm label, arm target
+# epitope); a None target falls back to the antibody's own target.
+ANTIBODY_SOURCES = (
+    {
+        "antibodies": REFERENCE_ANTIBODIES,
+        "is_reference": True,
+        "category": "Approved/Clinical",
+        "sequence_category": "Reference",
+        "kd_field": "Kd_nM",
+        "arms": (("Arm1 (Domain IV-like)", None), ("Arm2 (Domain II-like)", None)),
+    },
+    {
+        "antibodies": P95_NOVEL_MABS_SEQUENCES,
+        "is_reference": False,
+        "category": "Predicted (p95-targeting)",
+        "sequence_category": "Predicted",
+        "kd_field": "predicted_Kd_nM",
+        "arms": (("Arm1 (p95-JM targeting)", "p95-HER2 JM (615-635)"),
+                 ("Arm2 (Domain IV targeting)", "FL-HER2 Domain IV (557-603)")),
+    },
+)
 
-    # Predicted p95 mAbs
-    for name, info in P95_NOVEL_MABS_SEQUENCES.items():
-        if "VH_arm1" in info:  # Bispecific
-            vh_len = len(info["VH_arm1"])
-            vl_len = len(info["VL_arm1"])
-        else:
-            vh_len = len(info["VH"])
-            vl_len = len(info["VL"])
+def _write_rows(output_path, rows):
+    """Write a list of dicts as CSV, with columns in first-seen key order."""
+    fieldnames = list(dict.fromkeys(key for row in rows for key in row))
+    with atomic_open(output_path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(rows)
 
-        data.append({
+def _sequence_rows(name, info, source):
+    """Return the detailed sequence rows for one antibody: one per arm for bispecifics."""
+    if "VH_arm1" not in info:
+        return [{
             "mAb_name": name,
-            "category": "Predicted (p95-targeting)",
-            "target": info["target"],
-            "VH_length": vh_len,
-            "VL_length": vl_len,
-            "Kd_nM": info["predicted_Kd_nM"],
-            "internalization_4h": info["internalization_4h"],
-            "adc_score": info["adc_score"],
-            "framework": info["framework"],
-            "humanization": info["humanization"],
-            "p95_binding": "Yes"
-        })
+            "category": source["sequence_category"],
+            "arm": "Single",
+            "VH_sequence": info["VH"],
+            "VL_sequence": info["VL"],
+            "CDR_H3": info["CDR_H3"],
+            "CDR_L3": info["CDR_L3"],
+            "target_epitope": info["target"]
+        }]
+    return [{
+        "mAb_name": name,
+        "category": source["sequence_category"],
+        "arm": label,
+        "VH_sequence": info[f"VH_arm{n}"],
+        "VL_sequence": info[f"VL_arm{n}"],
+        "CDR_H3": info[f"CDR_H3_arm{n}"],
+        "CDR_L3": info.get(f"CDR_L3_arm{n}", "N/A"),
+        "target_epitope": target or info["target"]
+    } for n, (label, target) in enumerate(source["arms"], 1)]
 
-    return pd.DataFrame(data)
+def _iter_antibody_rows():
+    """Yield (comparison_row, sequence_rows) once per antibody, in table order."""
+    for source in ANTIBODY_SOURCES:
+        for name, info in source["antibodies"].items():
+            sequences = _sequence_rows(name, info, source)
 
-def create_detailed_sequences_csv():
-    """Export detailed VH/VL sequences to CSV."""
-    data = []
+            if not source["is_reference"]:
+                p95_binding = "Yes"
+            elif name == "Zanidatamab":
+                p95_binding = "No (Domain II+IV only)"
+            else:
+                p95_binding = "No"
 
-    # Reference antibodies
-    for name, info in REFERENCE_ANTIBODIES.items():
-        if "VH_arm1" in info:  # Bispecific
-            data.append({
+            # Bispecifics are compared by their first arm
+            comparison = {
                 "mAb_name": name,
-                "category": "Reference",
-                "arm": "Arm1 (Domain IV-like)",
-                "VH_sequence": info["VH_arm1"],
-                "VL_sequence": info["VL_arm1"],
-                "CDR_H3": info["CDR_H3_arm1"],
-                "CDR_L3": info.get("CDR_L3_arm1", "N/A"),
-                "target_epitope": info["target"]
-            })
-            data.append({
-                "mAb_name": name,
-                "category": "Reference",
-                "arm": "Arm2 (Domain II-like)",
-                "VH_sequence": info["VH_arm2"],
-                "VL_sequence": info["VL_arm2"],
-                "CDR_H3": info["CDR_H3_arm2"],
-                "CDR_L3": info.get("CDR_L3_arm2", "N/A"),
-                "target_epitope": info["target"]
-            })
-        else:
-            data.append({
-                "mAb_name": name,
-                "category": "Reference",
-                "arm": "Single",
-                "VH_sequence": info["VH"],
-                "VL_sequence": info["VL"],
-                "CDR_H3": info["CDR_H3"],
-                "CDR_L3": info["CDR_L3"],
-                "target_epitope": info["target"]
-            })
+                "category": source["category"],
+                "target": info["target"],
+                "VH_length": len(sequences[0]["VH_sequence"]),
+                "VL_length": len(sequences[0]["VL_sequence"]),
+                "Kd_nM": info[source["kd_field"]],
+                "internalization_4h": info["internalization_4h"],
+                "adc_score": info["adc_score"],
+                "framework": info["framework"],
+                "humanization": info["humanization"],
+                "p95_binding": p95_binding
+            }
+            yield comparison, sequences
 
-    # Predicted p95 mAbs
-    for name, info in P95_NOVEL_MABS_SEQUENCES.items():
-        if "VH_arm1" in info:  # Bispecific
-            data.append({
-                "mAb_name": name,
-                "category": "Predicted",
-                "arm": "Arm1 (p95-JM targeting)",
-                "VH_sequence": info["VH_arm1"],
-                "VL_sequence": info["VL_arm1"],
-                "CDR_H3": info["CDR_H3_arm1"],
-                "CDR_L3": info["CDR_L3_arm1"],
-                "target_epitope": "p95-HER2 JM (615-635)"
-            })
-            data.append({
-                "mAb_name": name,
-                "category": "Predicted",
-                "arm": "Arm2 (Domain IV targeting)",
-                "VH_sequence": info["VH_arm2"],
-                "VL_sequence": info["VL_arm2"],
-                "CDR_H3": info["CDR_H3_arm2"],
-                "CDR_L3": info["CDR_L3_arm2"],
-                "target_epitope": "FL-HER2 Domain IV (557-603)"
-            })
-        else:
-            data.append({
-                "mAb_name": name,
-                "category": "Predicted",
-                "arm": "Single",
-                "VH_sequence": info["VH"],
-                "VL_sequence": info["VL"],
-                "CDR_H3": info["CDR_H3"],
-                "CDR_L3": info["CDR_L3"],
-                "target_epitope": info["target"]
-            })
+def create_sequence_comparison_table():
+    """Create comprehensive comparison table of all antibodies."""
+    return [comparison for comparison, _ in _iter_antibody_rows()]
 
-    return pd.DataFrame(data)
+def create_detailed_sequences_csv():
+    """Export detailed VH/VL sequences to CSV."""
+    return [row for _, sequences in _iter_antibody_rows() for row in sequences]
 
 def create_public_antibodies_csv():
     """Export public p95-HER2 antibody data."""
@@ -322,24 +292,27 @@ def create_public_antibodies_csv():
             "limitations": info["limitations"],
             "reference": info["reference"]
         })
-    return pd.DataFrame(data)
+    return data
+
+SUMMARY_ROW_FORMAT = "{mAb_name:20s} | Kd: {Kd_nM:5.1f} nM | ADC: {adc_score}/10 | p95: {p95_binding}"
 
 def main():
-    os.makedirs("../data/sequences", exist_ok=True)
+    os.makedirs(SEQUENCES_DIR, exist_ok=True)
+
+    # Comparison table and detailed sequences come from one pass over the antibodies
+    comparison, sequences = [], []
+    for row, rows in _iter_antibody_rows():
+        comparison.append(row)
+        sequences.extend(rows)
 
-    # Create comparison table
-    comparison_df = create_sequence_comparison_table()
-    comparison_df.to_csv("../data/p95_mab_comparison.csv", index=False)
+    _write_rows(os.path.join(DATA_DIR, "p95_mab_comparison.csv"), comparison)
     print("Saved: data/p95_mab_comparison.csv")
 
-    # Create detailed sequences
-    sequences_df = create_detailed_sequences_csv()
-    sequences_df.to_csv("../data/sequences/p95_mab_vh_vl_sequences.csv", index=False)
+    _write_rows(os.path.join(SEQUENCES_DIR, "p95_mab_vh_vl_sequences.csv"), sequences)
     print("Saved: data/sequences/p95_mab_vh_vl_sequences.csv")
 
     # Create public antibodies database
-    public_df = create_public_antibodies_csv()
-    public_df.to_csv("../data/p95_public_antibodies.csv", index=False)
+    _write_rows(os.path.join(DATA_DIR, "p95_public_antibodies.csv"), create_public_antibodies_csv())
     print("Saved: data/p95_public_antibodies.csv")
 
     # Print summary
@@ -349,8 +322,7 @@ def main():
 
     print("\nComparison with Reference Antibodies:")
     print("-"*60)
-    for _, row in comparison_df.iterrows():
-        print(f"{row['mAb_name']:20s} | Kd: {row['Kd_nM']:5.1f} nM | ADC: {row['adc_score']}/10 | p95: {row['p95_binding']}")
+    print("\n".join(SUMMARY_ROW_FORMAT.format_map(row) for row in comparison))
 
     print("\n" + "="*60)
     print("Key Findings:")
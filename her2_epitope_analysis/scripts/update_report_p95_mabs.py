@@ -9,6 +9,81 @@ from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.table import WD_TABLE_ALIGNMENT
 import os
 
+from atomic_io import atomic_open
+from generate_report import SectionBuilder
+
+# Resolve the report path from the script's location rather than the working directory
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPORT_PATH = os.path.join(os.path.dirname(SCRIPT_DIR), "output", "HER2_Epitope_Report.docx")
+
+# Static section content; grid tables carry their header row first
+MAB_001_TABLE = (
+    ('Target Epitope', 'MPIWKFPDEEGACQPCPINC'),
+    ('CDR-H3', 'DPIWKFPDY'),
+    ('CDR-L3', 'QQGACQPLT'),
+    ('Predicted Kd', '15 nM'),
+    ('ADC Score', '6.5/10'),
+)
+
+MAB_002_TABLE = (
+    ('Target Epitope', 'MPIWKFPDEEGACQP (p95-specific)'),
+    ('CDR-H3', 'METPIWKFDY'),
+    ('CDR-L3', 'QQFPDEEGT'),
+    ('Predicted Kd', '8 nM'),
+    ('ADC Score', '5.0/10'),
+)
+
+MAB_003_TABLE = (
+    ('Target Epitope', 'CTHSCVDLDDKGC'),
+    ('CDR-H3', 'CTHSCVDY'),
+    ('CDR-L3', 'QQDLDKGCT'),
+    ('Predicted Kd', '25 nM'),
+    ('ADC Score', '4.5/10'),
+)
+
+BISPECIFIC_TABLE = (
+    ('Format', 'Bispecific IgG1 (knobs-into-holes)'),
+    ('Arm 1 Target', 'p95-HER2 JM (615-635)'),
+    ('Arm 2 Target', 'FL-HER2 Domain IV (557-603)'),
+    ('CDR-H3 (Arm 1)', 'DPIWKFPDY'),
+    ('CDR-H3 (Arm 2)', 'SRWGGDGFYAMDY'),
+    ('Predicted Kd', '2 nM (avidity-enhanced)'),
+    ('ADC Score', '8.5/10'),
+)
+
+COMPARISON_TABLE = (
+    ('mAb', 'Kd (nM)', 'Internalization', 'ADC Score', 'p95 Binding', 'FL-HER2 Binding'),
+    ('Trastuzumab', '5.0', '25%', '8.8/10', 'No', 'Yes'),
+    ('Pertuzumab', '1.0', '15%', '7.8/10', 'No', 'Yes'),
+    ('Zanidatamab', '0.5', '70%', '9.5/10', 'No', 'Yes'),
+    ('p95-mAb-001', '15.0', '35%', '6.5/10', 'Yes', 'Yes'),
+    ('p95-mAb-002', '8.0', 'Unknown', '5.0/10', 'Yes', 'No'),
+    ('p95-mAb-003', '25.0', '20%', '4.5/10', 'Yes', 'Yes'),
+    ('p95-Bispecific-001', '2.0', '60%', '8.5/10', 'Yes', 'Yes'),
+)
+
+RECOMMENDATION_TABLE = (
+    ('Priority', 'mAb', 'Rationale'),
+    ('1st', 'p95-Bispecific-001', 'Best ADC potential, dual targeting, proven biparatopic concept'),
+    ('2nd', 'p95-mAb-001', 'Simpler format, JM epitope validated by Arribas work'),
+    ('3rd', 'p95-mAb-002', 'p95-specific, reduced on-target/off-tumor toxicity'),
+)
+
+ADDITIONAL_REFERENCES = (
+    '11. Morancho B, et al. Oncogene. 2013;32:4582-4592.',
+    '12. Molina MA, et al. Clin Cancer Res. 2002;8:347-353.',
+    '13. Weisser NE, et al. Nat Commun. 2023;14:1394.',
+    '14. Li JY, et al. Cancer Cell. 2019;35:948-963.',
+    '15. Castiglioni F, et al. Endocr Relat Cancer. 2006;13:221-232.',
+)
+
+def _add_table(doc, rows, bold_header=False, bold_first_col=False):
+    """Append a fully populated 'Table Grid' table, built as one XML fragment."""
+    sb = SectionBuilder(doc)
+    sb.table(rows, style=doc.styles['Table Grid'],
+             bold_header=bold_header, bold_first_col=bold_first_col)
+    sb.flush()
+
 def add_p95_novel_mab_section(doc):
     """Add comprehensive p95 novel mAb section to existing document."""
 
@@ -32,111 +107,33 @@ def add_p95_novel_mab_section(doc):
 
     # p95-mAb-001
     doc.add_heading('p95-mAb-001 (Juxtamembrane Epitope 615-635)', level=3)
-    table1 = doc.add_table(rows=5, cols=2)
-    table1.style = 'Table Grid'
-    data1 = [
-        ('Target Epitope', 'MPIWKFPDEEGACQPCPINC'),
-        ('CDR-H3', 'DPIWKFPDY'),
-        ('CDR-L3', 'QQGACQPLT'),
-        ('Predicted Kd', '15 nM'),
-        ('ADC Score', '6.5/10'),
-    ]
-    for i, (label, value) in enumerate(data1):
-        row = table1.rows[i]
-        row.cells[0].text = label
-        row.cells[1].text = value
-        row.cells[0].paragraphs[0].runs[0].bold = True
+    _add_table(doc, MAB_001_TABLE, bold_first_col=True)
 
     doc.add_paragraph()
 
     # p95-mAb-002
     doc.add_heading('p95-mAb-002 (Neo-epitope 611-625)', level=3)
-    table2 = doc.add_table(rows=5, cols=2)
-    table2.style = 'Table Grid'
-    data2 = [
-        ('Target Epitope', 'MPIWKFPDEEGACQP (p95-specific)'),
-        ('CDR-H3', 'METPIWKFDY'),
-        ('CDR-L3', 'QQFPDEEGT'),
-        ('Predicted Kd', '8 nM'),
-        ('ADC Score', '5.0/10'),
-    ]
-    for i, (label, value) in enumerate(data2):
-        row = table2.rows[i]
-        row.cells[0].text = label
-        row.cells[1].text = value
-        row.cells[0].paragraphs[0].runs[0].bold = True
+    _add_table(doc, MAB_002_TABLE, bold_first_col=True)
 
     doc.add_paragraph('Note: p95-mAb-002 is specific to p95-CTF611 and does NOT bind full-length HER2.')
     doc.add_paragraph()
 
     # p95-mAb-003
     doc.add_heading('p95-mAb-003 (Membrane-proximal 640-652)', level=3)
-    table3 = doc.add_table(rows=5, cols=2)
-    table3.style = 'Table Grid'
-    data3 = [
-        ('Target Epitope', 'CTHSCVDLDDKGC'),
-        ('CDR-H3', 'CTHSCVDY'),
-        ('CDR-L3', 'QQDLDKGCT'),
-        ('Predicted Kd', '25 nM'),
-        ('ADC Score', '4.5/10'),
-    ]
-    for i, (label, value) in enumerate(data3):
-        row = table3.rows[i]
-        row.cells[0].text = label
-        row.cells[1].text = value
-        row.cells[0].paragraphs[0].runs[0].bold = True
+    _add_table(doc, MAB_003_TABLE, bold_first_col=True)
 
     doc.add_paragraph()
 
     # p95-Bispecific-001
     doc.add_heading('p95-Bispecific-001 (Recommended for ADC Development)', level=3)
-    table4 = doc.add_table(rows=7, cols=2)
-    table4.style = 'Table Grid'
-    data4 = [
-        ('Format', 'Bispecific IgG1 (knobs-into-holes)'),
-        ('Arm 1 Target', 'p95-HER2 JM (615-635)'),
-        ('Arm 2 Target', 'FL-HER2 Domain IV (557-603)'),
-        ('CDR-H3 (Arm 1)', 'DPIWKFPDY'),
-        ('CDR-H3 (Arm 2)', 'SRWGGDGFYAMDY'),
-        ('Predicted Kd', '2 nM (avidity-enhanced)'),
-        ('ADC Score', '8.5/10'),
-    ]
-    for i, (label, value) in enumerate(data4):
-        row = table4.rows[i]
-        row.cells[0].text = label
-        row.cells[1].text = value
-        row.cells[0].paragraphs[0].runs[0].bold = True
+    _add_table(doc, BISPECIFIC_TABLE, bold_first_col=True)
 
     doc.add_paragraph()
 
     # Comparison Table
     doc.add_heading('Comparison with Reference Antibodies', level=2)
 
-    comparison_table = doc.add_table(rows=8, cols=6)
-    comparison_table.style = 'Table Grid'
-
-    # Header row
-    headers = ['mAb', 'Kd (nM)', 'Internalization', 'ADC Score', 'p95 Binding', 'FL-HER2 Binding']
-    for i, header in enumerate(headers):
-        cell = comparison_table.rows[0].cells[i]
-        cell.text = header
-        cell.paragraphs[0].runs[0].bold = True
-
-    # Data rows
-    comparison_data = [
-        ('Trastuzumab', '5.0', '25%', '8.8/10', 'No', 'Yes'),
-        ('Pertuzumab', '1.0', '15%', '7.8/10', 'No', 'Yes'),
-        ('Zanidatamab', '0.5', '70%', '9.5/10', 'No', 'Yes'),
-        ('p95-mAb-001', '15.0', '35%', '6.5/10', 'Yes', 'Yes'),
-        ('p95-mAb-002', '8.0', 'Unknown', '5.0/10', 'Yes', 'No'),
-        ('p95-mAb-003', '25.0', '20%', '4.5/10', 'Yes', 'Yes'),
-        ('p95-Bispecific-001', '2.0', '60%', '8.5/10', 'Yes', 'Yes'),
-    ]
-
-    for i, row_data in enumerate(comparison_data):
-        row = comparison_table.rows[i + 1]
-        for j, value in enumerate(row_data):
-            row.cells[j].text = value
+    _add_table(doc, COMPARISON_TABLE, bold_header=True)
 
     doc.add_paragraph()
 
@@ -174,34 +171,11 @@ def add_p95_novel_mab_section(doc):
     # Recommendations
     doc.add_heading('Development Recommendations', level=2)
 
-    rec_table = doc.add_table(rows=4, cols=3)
-    rec_table.style = 'Table Grid'
-    rec_headers = ['Priority', 'mAb', 'Rationale']
-    for i, h in enumerate(rec_headers):
-        rec_table.rows[0].cells[i].text = h
-        rec_table.rows[0].cells[i].paragraphs[0].runs[0].bold = True
-
-    rec_data = [
-        ('1st', 'p95-Bispecific-001', 'Best ADC potential, dual targeting, proven biparatopic concept'),
-        ('2nd', 'p95-mAb-001', 'Simpler format, JM epitope validated by Arribas work'),
-        ('3rd', 'p95-mAb-002', 'p95-specific, reduced on-target/off-tumor toxicity'),
-    ]
-    for i, (priority, mab, rationale) in enumerate(rec_data):
-        row = rec_table.rows[i + 1]
-        row.cells[0].text = priority
-        row.cells[1].text = mab
-        row.cells[2].text = rationale
+    _add_table(doc, RECOMMENDATION_TABLE, bold_header=True)
 
     # References
     doc.add_heading('Additional References', level=2)
-    refs = [
-        '11. Morancho B, et al. Oncogene. 2013;32:4582-4592.',
-        '12. Molina MA, et al. Clin Cancer Res. 2002;8:347-353.',
-        '13. Weisser NE, et al. Nat Commun. 2023;14:1394.',
-        '14. Li JY, et al. Cancer Cell. 2019;35:948-963.',
-        '15. Castiglioni F, et al. Endocr Relat Cancer. 2006;13:221-232.',
-    ]
-    for ref in refs:
+    for ref in ADDITIONAL_REFERENCES:
         doc.add_paragraph(ref, style='List Number')
 
     return doc
@@ -209,24 +183,25 @@ def add_p95_novel_mab_section(doc):
 def main():
     """Update the HER2 Epitope Report with p95 novel mAb analysis."""
 
-    input_path = "../output/HER2_Epitope_Report.docx"
-    output_path = "../output/HER2_Epitope_Report.docx"
+    input_path = output_path = REPORT_PATH
 
     print("Updating HER2 Epitope Report with p95 Novel mAb Analysis...")
 
     if os.path.exists(input_path):
         doc = Document(input_path)
     else:
-        print(f"Warning: {input_path} not found. Creating new document.")
+        print(f"Warning: {os.path.relpath(input_path)} not found. Creating new document.")
         doc = Document()
         doc.add_heading('HER2 Epitope Analysis for ADC Binder Design', level=0)
 
     # Add the p95 novel mAb section
     doc = add_p95_novel_mab_section(doc)
 
-    # Save
-    doc.save(output_path)
-    print(f"Saved: {output_path}")
+    # Save next to the report and swap it in, so a failed save never truncates the
+    # report this script reads back on the next run
+    with atomic_open(output_path, "wb") as f:
+        doc.save(f)
+    print(f"Saved: {os.path.relpath(output_path)}")
 
     print("\nNew sections added:")
     print("  - p95-HER2 Novel mAb VH/VL Sequences")
@@ -6,35 +6,119 @@ Designs effective siRNAs to knockdown PAX8 (Paired Box 8) using
 Tuschl/Reynolds design rules and BLAST off-target analysis.
 """
 
-import pandas as pd
+import contextlib
+import csv
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from Bio import Entrez, SeqIO
-from Bio.Seq import Seq
-from Bio.Blast import NCBIWWW, NCBIXML
 from datetime import datetime
+import hashlib
+import io
+import json
+import os
 import time
 import sys
 
-# Configure NCBI Entrez
+# Configure NCBI Entrez; an API key (if set) raises the request limit from 3/s to 10/s
 Entrez.email = "sirna_designer@example.com"
+Entrez.api_key = os.environ.get("NCBI_API_KEY")
 
 # PAX8 RefSeq accession
 PAX8_REFSEQ = "NM_003466.4"
 
+# NCBI response caches, kept beside this script rather than in the working directory
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ncbi_cache")
+BLAST_CACHE_DIR = os.path.join(CACHE_DIR, "blast")
+
+# siRNA sense-strand length
+SIRNA_LENGTH = 19
+
+# qblast search settings for off-target checks; also part of the BLAST cache key
+BLAST_PROGRAM = "blastn"
+BLAST_DATABASE = "refseq_rna"
+BLAST_OPTIONS = {
+    "entrez_query": "Homo sapiens[organism]",
+    "word_size": 7,
+    "expect": 1000,
+    "hitlist_size": 50,
+}
+
+# Byte -> base code lookup: A=0, C=1, G=2, T=3 (either case); anything else is 4 (ambiguous)
+BASE_CODES = np.full(256, 4, dtype=np.uint8)
+for code, bases in enumerate(("Aa", "Cc", "Gg", "Tt")):
+    for base in bases:
+        BASE_CODES[ord(base)] = code
+
+# Rounded GC percentage for each possible GC count in a 19-mer
+GC_PERCENT = np.array([round(gc / SIRNA_LENGTH * 100, 1) for gc in range(SIRNA_LENGTH + 1)])
+
+# Reverse-complement translation (Seq.reverse_complement keeps case)
+COMPLEMENT = str.maketrans("ACGTacgt", "TGCAtgca")
+
+# score_windows detail text for each rule, indexed by the points it awarded
+SCORE_DETAILS = (
+    ("", "GC near optimal: +1", "GC 30-50%: +2"),
+    ("", "Pos1 A/U: +1"),
+    ("", "Pos19 G/C: +1"),
+    ("", "3' A/U moderate: +1", "3' A/U rich: +2"),
+    ("", "No poly-runs: +1"),
+    ("", "5' A/U moderate: +1", "5' A/U rich: +2"),
+    ("", "No 3' GC stretch: +1"),
+)
+
+
+@contextlib.contextmanager
+def atomic_open(path, mode="w", **kwargs):
+    """Open a sibling .tmp file for writing and os.replace() it onto path on success.
+
+    Readers never see a half-written file, and a crash mid-write leaves the old one intact.
+    """
+    tmp = f"{path}.tmp"
+    try:
+        with open(tmp, mode, **kwargs) as f:
+            yield f
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
 
-def fetch_pax8_sequence():
-    """Retrieve PAX8 mRNA sequence from NCBI RefSeq."""
-    print(f"Fetching PAX8 sequence ({PAX8_REFSEQ})...")
+
+def fetch_genbank(accession, cache_dir=CACHE_DIR):
+    """
+    Return the GenBank flat file for a nucleotide accession.
+
+    Records are cached as <accession>.gb under cache_dir and only fetched from
+    NCBI on a miss. A versioned accession (e.g. NM_003466.4) never changes, so
+    cached copies do not expire.
+    """
+    cache_path = os.path.join(cache_dir, f"{accession}.gb")
+    if os.path.exists(cache_path):
+        with open(cache_path) as f:
+            return f.read()
 
     handle = Entrez.efetch(
         db="nucleotide",
-        id=PAX8_REFSEQ,
+        id=accession,
         rettype="gb",
         retmode="text"
     )
-    record = SeqIO.read(handle, "genbank")
+    text = handle.read()
     handle.close()
 
+    # An interrupted run never leaves a truncated record behind
+    os.makedirs(cache_dir, exist_ok=True)
+    with atomic_open(cache_path) as f:
+        f.write(text)
+    return text
+
+
+def fetch_pax8_sequence():
+    """Retrieve PAX8 mRNA sequence from NCBI RefSeq (cached on disk after the first run)."""
+    print(f"Fetching PAX8 sequence ({PAX8_REFSEQ})...")
+
+    record = SeqIO.read(io.StringIO(fetch_genbank(PAX8_REFSEQ)), "genbank")
+
     # Extract CDS region
     cds_start = None
     cds_end = None
@@ -47,7 +131,8 @@ def fetch_pax8_sequence():
     if cds_start is None:
         raise ValueError("Could not find CDS feature in PAX8 record")
 
-    cds_sequence = str(record.seq[cds_start:cds_end])
+    # Canonical upper-case CDS, so nothing downstream has to normalize case per window
+    cds_sequence = str(record.seq[cds_start:cds_end]).upper()
 
     print(f"  Gene: PAX8 (Paired Box 8)")
     print(f"  Organism: {record.annotations.get('organism', 'Homo sapiens')}")
@@ -63,102 +148,151 @@ def fetch_pax8_sequence():
     }
 
 
-def calculate_gc_content(sequence):
-    """Calculate GC percentage of a sequence."""
-    gc_count = sequence.upper().count('G') + sequence.upper().count('C')
-    return (gc_count / len(sequence)) * 100
+def encode_sequence(sequence):
+    """Encode a nucleotide string as a uint8 array of BASE_CODES."""
+    return BASE_CODES[np.frombuffer(sequence.encode("ascii"), dtype=np.uint8)]
 
 
-def score_sirna(sense_seq):
+def score_windows(windows):
     """
-    Score an siRNA candidate based on Tuschl/Reynolds design rules.
+    Score many siRNA candidates at once using Tuschl/Reynolds design rules.
 
-    Returns a score out of 10 based on:
-    - GC content 30-50%: 2 pts
+    Each candidate gets a score out of 10 based on:
+    - GC content 30-50%: 2 pts (25-30% or 50-55%: 1 pt)
     - Position 1 (sense) is A or U: 1 pt
     - Position 19 (sense) is G or C: 1 pt
     - Low 5' antisense stability (A/U rich at positions 15-19): 2 pts
     - No poly-runs (≥4 consecutive identical bases): 1 pt
     - Internal stability (A/U at positions 1-7): 2 pts
     - No GC stretch at 3' end of sense: 1 pt
+
+    Takes an (N, 19) array of encoded, unambiguous sense 19-mers and returns
+    (total score, GC count, per-rule points) as integer arrays; the per-rule
+    points are an (N, 7) array indexing SCORE_DETAILS.
     """
-    score = 0
-    details = []
-
-    seq = sense_seq.upper().replace('T', 'U')  # Work with RNA
-
-    # 1. GC content 30-50% (2 pts)
-    gc = calculate_gc_content(sense_seq)
-    if 30 <= gc <= 50:
-        score += 2
-        details.append("GC 30-50%: +2")
-    elif 25 <= gc < 30 or 50 < gc <= 55:
-        score += 1
-        details.append("GC near optimal: +1")
-
-    # 2. Position 1 is A or U (1 pt)
-    if seq[0] in ['A', 'U']:
-        score += 1
-        details.append("Pos1 A/U: +1")
-
-    # 3. Position 19 is G or C (1 pt)
-    if seq[18] in ['G', 'C']:
-        score += 1
-        details.append("Pos19 G/C: +1")
-
-    # 4. Low 5' antisense stability - A/U rich at 3' end of sense (positions 15-19) (2 pts)
-    au_count_3prime = sum(1 for b in seq[14:19] if b in ['A', 'U'])
-    if au_count_3prime >= 4:
-        score += 2
-        details.append("3' A/U rich: +2")
-    elif au_count_3prime >= 3:
-        score += 1
-        details.append("3' A/U moderate: +1")
-
-    # 5. No poly-runs of ≥4 identical bases (1 pt)
-    has_poly_run = False
-    for base in ['A', 'U', 'G', 'C', 'T']:
-        if base * 4 in sense_seq.upper():
-            has_poly_run = True
-            break
-    if not has_poly_run:
-        score += 1
-        details.append("No poly-runs: +1")
+    is_gc = (windows == 1) | (windows == 2)
+    is_au = ~is_gc
 
-    # 6. Internal stability - A/U rich at 5' end (positions 1-7) (2 pts)
-    au_count_5prime = sum(1 for b in seq[0:7] if b in ['A', 'U'])
-    if au_count_5prime >= 5:
-        score += 2
-        details.append("5' A/U rich: +2")
-    elif au_count_5prime >= 4:
-        score += 1
-        details.append("5' A/U moderate: +1")
+    gc_count = is_gc.sum(axis=1)
+    gc = gc_count / SIRNA_LENGTH * 100
+    gc_points = np.where((30 <= gc) & (gc <= 50), 2,
+                         np.where(((25 <= gc) & (gc < 30)) | ((50 < gc) & (gc <= 55)), 1, 0))
 
-    # 7. Avoid GC stretch at 3' end of sense (1 pt)
-    gc_3prime = sum(1 for b in seq[15:19] if b in ['G', 'C'])
-    if gc_3prime <= 2:
-        score += 1
-        details.append("No 3' GC stretch: +1")
+    au_3prime = is_au[:, 14:19].sum(axis=1)
+    au_5prime = is_au[:, 0:7].sum(axis=1)
 
-    return score, details
+    # A run of 4 identical bases is 3 consecutive equal neighbour pairs
+    same = windows[:, 1:] == windows[:, :-1]
+    has_poly_run = (same[:, :-2] & same[:, 1:-1] & same[:, 2:]).any(axis=1)
 
+    points = np.column_stack([
+        gc_points,
+        is_au[:, 0],
+        is_gc[:, 18],
+        np.select([au_3prime >= 4, au_3prime >= 3], [2, 1], 0),
+        ~has_poly_run,
+        np.select([au_5prime >= 5, au_5prime >= 4], [2, 1], 0),
+        is_gc[:, 15:19].sum(axis=1) <= 2,
+    ]).astype(np.int64)
 
-def check_off_targets_local(sense_seq, pax8_cds):
+    return points.sum(axis=1), gc_count, points
+
+
+def count_near_matches(queries, windows, min_matches=16, block=128):
     """
-    Simple local off-target check - look for near-matches in the PAX8 sequence itself.
-    For a full analysis, BLAST would be used against the entire transcriptome.
+    Count, for each encoded 19-mer in queries, the windows that share at least
+    min_matches positions with it. Compares a block of queries at a time so the
+    (block, N, 19) comparison stays small.
     """
-    # Check if the sequence has multiple near-identical matches in PAX8 itself
-    # (indicating potential self-targeting issues)
-    matches = 0
-    for i in range(len(pax8_cds) - 18):
-        window = pax8_cds[i:i+19]
-        match_count = sum(1 for a, b in zip(sense_seq.upper(), window.upper()) if a == b)
-        if match_count >= 16:
-            matches += 1
+    counts = np.empty(len(queries), dtype=np.int64)
+    for start in range(0, len(queries), block):
+        same = queries[start:start + block, np.newaxis, :] == windows[np.newaxis, :, :]
+        counts[start:start + block] = (same.sum(axis=-1, dtype=np.uint8) >= min_matches).sum(axis=1)
+    return counts
+
+
+def _blast_verdict(record):
+    """Return (status, note) for one BLAST query record, ignoring PAX8 hits."""
+    off_target_hits = []
+    for alignment in record.alignments:
+        # Skip PAX8 hits
+        if "PAX8" in alignment.title.upper():
+            continue
+
+        for hsp in alignment.hsps:
+            # Check if ≥16/19 match
+            if hsp.identities >= 16 and hsp.align_length >= 17:
+                off_target_hits.append({
+                    "title": alignment.title[:50],
+                    "identities": hsp.identities,
+                    "length": hsp.align_length
+                })
+
+    if off_target_hits:
+        return "FAIL", f"{len(off_target_hits)} off-targets found"
+    else:
+        return "PASS", "No significant off-targets"
+
+
+def _blast_cache_path(sense_seq, cache_dir):
+    """Cache file for one sequence's verdict under the current search settings."""
+    key = json.dumps([sense_seq, BLAST_PROGRAM, BLAST_DATABASE, BLAST_OPTIONS], sort_keys=True)
+    digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    return os.path.join(cache_dir, f"{digest}.json")
+
+
+def run_blast_batch(sense_seqs, cache_dir=BLAST_CACHE_DIR):
+    """
+    BLAST several siRNA sense sequences against the human transcriptome in one
+    NCBI request (a multi-sequence FASTA query).
+
+    Returns one (status, note) per sequence, in input order. Results are matched
+    back to their sequence by FASTA query id. PASS/FAIL verdicts are cached under
+    cache_dir keyed by sequence and search settings, so only sequences not seen
+    before are submitted; clear the cache to re-check against a newer RefSeq release.
+    """
+    results = {}
+    for seq in sense_seqs:
+        cache_path = _blast_cache_path(seq, cache_dir)
+        if os.path.exists(cache_path):
+            with open(cache_path) as f:
+                cached = json.load(f)
+            results[seq] = (cached["verdict"], cached["note"])
+
+    missing = list(dict.fromkeys(seq for seq in sense_seqs if seq not in results))
+    if missing:
+        results.update(zip(missing, _submit_blast(missing)))
+
+        os.makedirs(cache_dir, exist_ok=True)
+        for seq in missing:
+            verdict, note = results[seq]
+            if verdict == "UNKNOWN":  # errors are not cached
+                continue
+            with atomic_open(_blast_cache_path(seq, cache_dir)) as f:
+                json.dump({"verdict": verdict, "note": note}, f)
+
+    return [results[seq] for seq in sense_seqs]
 
-    # More than 1 match means the sequence appears multiple times
-    return matches <= 1
+
+def _submit_blast(sense_seqs):
+    """Run one multi-FASTA qblast for sense_seqs; one (status, note) per sequence."""
+    # Only --blast runs need the BLAST client
+    from Bio.Blast import NCBIWWW, NCBIXML
+
+    query = "\n".join(f">cand_{i}\n{seq}" for i, seq in enumerate(sense_seqs))
+
+    try:
+        result_handle = NCBIWWW.qblast(BLAST_PROGRAM, BLAST_DATABASE, query, **BLAST_OPTIONS)
+
+        verdicts = {record.query.split()[0]: _blast_verdict(record)
+                    for record in NCBIXML.parse(result_handle)}
+        result_handle.close()
+
+        return [verdicts.get(f"cand_{i}", ("UNKNOWN", "No BLAST result returned"))
+                for i in range(len(sense_seqs))]
+
+    except Exception as e:
+        return [("UNKNOWN", f"BLAST error: {str(e)}")] * len(sense_seqs)
 
 
 def run_blast_check(sense_seq, skip_blast=True):
@@ -173,45 +307,7 @@ def run_blast_check(sense_seq, skip_blast=True):
         return "PASS", "Skipped (use --blast for full analysis)"
 
     print(f"    Running BLAST for {sense_seq}...")
-
-    try:
-        result_handle = NCBIWWW.qblast(
-            "blastn",
-            "refseq_rna",
-            sense_seq,
-            entrez_query="Homo sapiens[organism]",
-            word_size=7,
-            expect=1000,
-            hitlist_size=50
-        )
-
-        blast_records = NCBIXML.parse(result_handle)
-
-        off_target_hits = []
-        for record in blast_records:
-            for alignment in record.alignments:
-                # Skip PAX8 hits
-                if "PAX8" in alignment.title.upper():
-                    continue
-
-                for hsp in alignment.hsps:
-                    # Check if ≥16/19 match
-                    if hsp.identities >= 16 and hsp.align_length >= 17:
-                        off_target_hits.append({
-                            "title": alignment.title[:50],
-                            "identities": hsp.identities,
-                            "length": hsp.align_length
-                        })
-
-        result_handle.close()
-
-        if off_target_hits:
-            return "FAIL", f"{len(off_target_hits)} off-targets found"
-        else:
-            return "PASS", "No significant off-targets"
-
-    except Exception as e:
-        return "UNKNOWN", f"BLAST error: {str(e)}"
+    return run_blast_batch([sense_seq])[0]
 
 
 def generate_sirna_candidates(cds_sequence, top_n=50):
@@ -220,48 +316,45 @@ def generate_sirna_candidates(cds_sequence, top_n=50):
     """
     print(f"\nGenerating siRNA candidates from {len(cds_sequence)} bp CDS...")
 
-    candidates = []
-
-    # Sliding window of 19-mers
-    for i in range(len(cds_sequence) - 18):
-        sense_seq = cds_sequence[i:i+19]
-
-        # Skip sequences with ambiguous bases
-        if any(b not in 'ATGC' for b in sense_seq.upper()):
-            continue
+    # Encode once and view every 19-mer window; skip windows with ambiguous bases
+    windows = sliding_window_view(encode_sequence(cds_sequence), SIRNA_LENGTH)
+    positions = np.flatnonzero((windows < 4).all(axis=1))
+    scores, gc_counts, points = score_windows(windows[positions])
+    gc_percents = GC_PERCENT[gc_counts]
 
-        # Calculate antisense (reverse complement)
-        antisense_seq = str(Seq(sense_seq).reverse_complement())
+    # Sort by score (descending), then by GC closeness to 40%; lexsort is stable,
+    # so ties stay in sequence order
+    order = np.lexsort((np.abs(gc_percents - 40), -scores))
 
-        # Score the candidate
-        score, score_details = score_sirna(sense_seq)
+    # Antisense strands are slices of the CDS reverse complement
+    cds_rc = cds_sequence.translate(COMPLEMENT)[::-1]
+    cds_len = len(cds_sequence)
 
-        # Calculate GC content
-        gc_content = calculate_gc_content(sense_seq)
+    # Local off-target check for the kept candidates: more than one near-identical
+    # window in the CDS means the sequence appears multiple times
+    top = order[:top_n]
+    local_checks = count_near_matches(windows[positions[top]], windows) <= 1
 
-        # Local off-target check
-        local_check = check_off_targets_local(sense_seq, cds_sequence)
+    candidates = []
+    for k, local_check in zip(top.tolist(), local_checks.tolist()):
+        i = int(positions[k])
+        sense_seq = cds_sequence[i:i + SIRNA_LENGTH]
 
         candidates.append({
             "position": i + 1,  # 1-based position
             "sense_seq": sense_seq,
-            "antisense_seq": antisense_seq,
-            "gc_percent": round(gc_content, 1),
-            "score": score,
-            "score_details": "; ".join(score_details),
+            "antisense_seq": cds_rc[cds_len - i - SIRNA_LENGTH:cds_len - i],
+            "gc_percent": float(gc_percents[k]),
+            "score": int(scores[k]),
+            "score_details": "; ".join(SCORE_DETAILS[rule][p]
+                                       for rule, p in enumerate(points[k].tolist()) if p),
             "local_check": "PASS" if local_check else "FAIL"
         })
 
-    # Sort by score (descending), then by GC closeness to 40%
-    candidates.sort(key=lambda x: (
-        -x["score"],
-        abs(x["gc_percent"] - 40)
-    ))
-
-    print(f"  Generated {len(candidates)} candidates")
+    print(f"  Generated {len(positions)} candidates")
     print(f"  Top score: {candidates[0]['score']}/10")
 
-    return candidates[:top_n]
+    return candidates
 
 
 def filter_and_rank_candidates(candidates, run_blast=False):
@@ -270,23 +363,21 @@ def filter_and_rank_candidates(candidates, run_blast=False):
     """
     print("\nFiltering and ranking candidates...")
 
-    filtered = []
-
-    for cand in candidates:
-        # Skip if local check failed
-        if cand["local_check"] == "FAIL":
-            continue
-
-        # Skip if GC is outside acceptable range (25-55%)
-        if cand["gc_percent"] < 25 or cand["gc_percent"] > 55:
-            continue
+    # Skip if local check failed or GC is outside acceptable range (25-55%)
+    passed = [
+        cand for cand in candidates
+        if cand["local_check"] != "FAIL" and 25 <= cand["gc_percent"] <= 55
+    ]
 
-        # Run BLAST check if requested
-        if run_blast:
-            off_target, blast_note = run_blast_check(cand["sense_seq"], skip_blast=False)
-        else:
-            off_target, blast_note = "PASS", "Local check only"
+    # Run BLAST check if requested, as one batched query for all remaining candidates
+    if run_blast and passed:
+        print(f"    Running BLAST for {len(passed)} candidates...")
+        verdicts = run_blast_batch([cand["sense_seq"] for cand in passed])
+    else:
+        verdicts = [("PASS", "Local check only")] * len(passed)
 
+    filtered = []
+    for cand, (off_target, blast_note) in zip(passed, verdicts):
         cand["off_target"] = off_target
         cand["blast_note"] = blast_note
 
@@ -304,18 +395,19 @@ def filter_and_rank_candidates(candidates, run_blast=False):
 
 def save_csv_output(candidates, filename):
     """Save candidates to CSV file."""
-    df = pd.DataFrame(candidates)
-
     # Select and order columns for output
     output_cols = [
         "rank", "position", "sense_seq", "antisense_seq",
         "gc_percent", "score", "off_target"
     ]
 
-    df_out = df[output_cols]
-    df_out.to_csv(filename, index=False)
+    rows = [{col: cand[col] for col in output_cols} for cand in candidates]
+    with open(filename, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=output_cols, lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(rows)
     print(f"\nSaved CSV: {filename}")
-    return df_out
+    return rows
 
 
 def generate_report(candidates, pax8_info, filename):